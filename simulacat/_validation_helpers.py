@@ -18,6 +18,11 @@ type RepositoryKey = tuple[str, str]
 _ALLOWED_REPOSITORY_VISIBILITIES = frozenset({"all", "private", "public"})
 
 
+def _as_tuple[T](value: tuple[T, ...]) -> tuple[T, ...]:
+    """Return ``value`` as a tuple, skipping conversion when already one."""
+    return value if type(value) is tuple else tuple(value)
+
+
 def _require_text(value: object, label: str) -> str:
     if not isinstance(value, str) or not value.strip():
         msg = f"{label} must be a non-empty string"
@@ -26,7 +31,8 @@ def _require_text(value: object, label: str) -> str:
 
 
 def _require_positive_int(value: object, label: str) -> int:
-    if isinstance(value, bool) or not isinstance(value, int) or value <= 0:
+    # Exact type check rejects bool (an int subclass) in a single comparison.
+    if type(value) is not int or value <= 0:
         msg = f"{label} must be a positive integer"
         raise ConfigValidationError(msg)
     return value
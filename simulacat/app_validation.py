@@ -70,11 +70,17 @@ def validate_tokens(
             raise ConfigValidationError(msg)
         token_values.append(value)
 
-        permissions = [
+        permissions = frozenset(
             _require_text(permission, "Token permission")
             for permission in token.permissions
-        ]
-        _ensure_unique(permissions, f"token permission for {value!r}")
+        )
+        if len(permissions) != len(token.permissions):
+            # Cold path: rescan the raw tuple so the error names the
+            # duplicated permission, not just the token.
+            _ensure_unique(
+                list(token.permissions),
+                f"token permission for {value!r}",
+            )
 
         repositories = [
             _require_text(repo, "Token repository") for repo in token.repositories
@@ -191,6 +197,9 @@ def validate_app_installations(  # noqa: PLR0913, PLR0917 — FIXME: consider a
 
     """
     all_token_values: list[str] = list(token_values)
+    # Shadow set for O(1) duplicate checks; the list preserves ordering for
+    # the returned pool.
+    seen_token_values = set(all_token_values)
     installation_ids: list[str] = []
     for installation in app_installations:
         _require_positive_int(installation.installation_id, "Installation ID")
@@ -225,20 +234,24 @@ def validate_app_installations(  # noqa: PLR0913, PLR0917 — FIXME: consider a
                 )
                 raise ConfigValidationError(msg)
 
-        permissions = [
+        permissions = frozenset(
             _require_text(perm, "Installation permission")
             for perm in installation.permissions
-        ]
-        _ensure_unique(
-            permissions,
-            f"installation permission for installation {installation.installation_id}",
         )
+        if len(permissions) != len(installation.permissions):
+            # Cold path: rescan the raw tuple so the error names the
+            # duplicated permission, not just the installation.
+            _ensure_unique(
+                list(installation.permissions),
+                "installation permission for installation "
+                f"{installation.installation_id}",
+            )
 
         if installation.access_token is not None:
             value = _require_text(
                 installation.access_token, "Installation access token"
             )
-            if value in all_token_values:
+            if value in seen_token_values:
                 msg = (
                     f"Duplicate token value: installation "
                     f"{installation.installation_id} access_token "
@@ -246,6 +259,7 @@ def validate_app_installations(  # noqa: PLR0913, PLR0917 — FIXME: consider a
                 )
                 raise ConfigValidationError(msg)
             all_token_values.append(value)
+            seen_token_values.add(value)
 
     _ensure_unique(installation_ids, "installation ID")
     return all_token_values
@@ -281,7 +295,7 @@ def validate_default_token(
     tokens: tuple[AccessToken, ...],
     app_installations: tuple[AppInstallation, ...],
     default_token: str | None,
-) -> None:
+) -> str | None:
     """Validate default_token against all token sources.
 
     This must be called after both token and app-installation validation
@@ -296,6 +310,11 @@ def validate_default_token(
     default_token
         The configured default token value, or ``None``.
 
+    Returns
+    -------
+    str | None
+        The resolved auth token value, or ``None`` when no tokens exist.
+
     Raises
     ------
     ConfigValidationError
@@ -303,8 +322,7 @@ def validate_default_token(
 
     """
     all_values = collect_all_token_values(tokens, app_installations)
-    _select_auth_token_value(all_values, default_token)
-    return  # noqa: PLR1711 — R503: explicit end-of-function return
+    return _select_auth_token_value(all_values, default_token)
 
 
 __all__ = [
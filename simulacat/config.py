@@ -7,7 +7,6 @@ Python context.
 
 from __future__ import annotations
 
-import json
 import typing as typ
 
 if typ.TYPE_CHECKING:
@@ -35,6 +34,14 @@ def default_github_sim_config() -> GitHubSimConfig:
 def is_json_serializable(value: object) -> bool:
     """Check if a value can be serialized to JSON.
 
+    The value is walked with isinstance checks instead of attempting
+    ``json.dumps`` and catching ``TypeError``, so rejection costs a few
+    type tests rather than exception construction and unwinding. The
+    accepted shapes mirror ``json.dumps`` defaults: mappings with scalar
+    keys, lists and tuples, strings, numbers, booleans, and ``None``.
+    Self-referential containers are reported as unserializable, matching
+    ``json.dumps`` raising ``ValueError`` on circular references.
+
     Parameters
     ----------
     value
@@ -46,12 +53,29 @@ def is_json_serializable(value: object) -> bool:
         True if the value can be serialized to JSON, False otherwise.
 
     """
-    try:
-        json.dumps(value)
-    except (TypeError, ValueError):
-        return False
-    else:
+    return _walk_json_serializable(value, set())
+
+
+def _walk_json_serializable(value: object, seen: set[int]) -> bool:
+    """Walk ``value`` recursively, tracking container ids to break cycles."""
+    if value is None or isinstance(value, str | int | float):
         return True
+    if not isinstance(value, list | tuple | dict):
+        return False
+    if id(value) in seen:
+        return False
+    seen.add(id(value))
+    try:
+        if isinstance(value, dict):
+            return all(
+                (key is None or isinstance(key, str | int | float))
+                and _walk_json_serializable(item, seen)
+                for key, item in value.items()
+            )
+        return all(_walk_json_serializable(item, seen) for item in value)
+    finally:
+        # Discard on the way out so shared (non-cyclic) subtrees still pass.
+        seen.discard(id(value))
 
 
 def merge_configs(*configs: cabc.Mapping[str, typ.Any]) -> GitHubSimConfig:
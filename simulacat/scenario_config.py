@@ -25,12 +25,11 @@ import typing as typ
 from ._validation_helpers import (
     ConfigValidationError,
     RepositoryKey,
+    _as_tuple,
     _ensure_unique,
     _require_text,
-    _select_auth_token_value,
 )
 from .app_validation import (
-    collect_all_token_values,
     validate_app_installations,
     validate_apps,
     validate_default_token,
@@ -53,15 +52,34 @@ from .scenario_models import (
 if typ.TYPE_CHECKING:
     from .types import GitHubSimConfig
 
+# Top-level keys ``to_simulator_config`` emits. The key set depends only on
+# the ``include_unsupported`` flag, never on scenario contents, so key-only
+# checks can skip serialization entirely.
+_BASE_CONFIG_KEYS = frozenset({
+    "users",
+    "organizations",
+    "repositories",
+    "branches",
+    "blobs",
+})
+_UNSUPPORTED_CONFIG_KEYS = frozenset({"issues", "pull_requests"})
 
-@dc.dataclass(frozen=True, slots=True)
+
+@dc.dataclass(slots=True)
 class _ScenarioIndexes:
-    """Internal validated indexes for scenario configuration."""
+    """Internal validated indexes for scenario configuration.
+
+    Mutable (unlike the frozen ``ScenarioConfig`` that owns it) so lazily
+    computed caches can be filled in place without re-allocating the
+    container.
+    """
 
     org_logins: set[str]
     user_logins: set[str]
     repo_index: dict[RepositoryKey, Repository]
     branch_index: dict[RepositoryKey, dict[str, Branch]]
+    auth_token_candidates: tuple[str, ...]
+    resolved_auth_token: str | None
 
 
 @dc.dataclass(frozen=True, slots=True)
@@ -72,15 +90,15 @@ class ScenarioConfig:
     depending on the simulator's internal JSON schema.
     """
 
-    users: tuple[User, ...] = dc.field(default_factory=tuple)
-    organizations: tuple[Organization, ...] = dc.field(default_factory=tuple)
-    repositories: tuple[Repository, ...] = dc.field(default_factory=tuple)
-    branches: tuple[Branch, ...] = dc.field(default_factory=tuple)
-    issues: tuple[Issue, ...] = dc.field(default_factory=tuple)
-    pull_requests: tuple[PullRequest, ...] = dc.field(default_factory=tuple)
-    tokens: tuple[AccessToken, ...] = dc.field(default_factory=tuple)
-    apps: tuple[GitHubApp, ...] = dc.field(default_factory=tuple)
-    app_installations: tuple[AppInstallation, ...] = dc.field(default_factory=tuple)
+    users: tuple[User, ...] = ()
+    organizations: tuple[Organization, ...] = ()
+    repositories: tuple[Repository, ...] = ()
+    branches: tuple[Branch, ...] = ()
+    issues: tuple[Issue, ...] = ()
+    pull_requests: tuple[PullRequest, ...] = ()
+    tokens: tuple[AccessToken, ...] = ()
+    apps: tuple[GitHubApp, ...] = ()
+    app_installations: tuple[AppInstallation, ...] = ()
     default_token: str | None = None
     _indexes: _ScenarioIndexes | None = dc.field(
         init=False,
@@ -91,15 +109,15 @@ class ScenarioConfig:
 
     def __post_init__(self) -> None:
         """Normalize scenario collections into tuples for immutability."""
-        object.__setattr__(self, "users", tuple(self.users))
-        object.__setattr__(self, "organizations", tuple(self.organizations))
-        object.__setattr__(self, "repositories", tuple(self.repositories))
-        object.__setattr__(self, "branches", tuple(self.branches))
-        object.__setattr__(self, "issues", tuple(self.issues))
-        object.__setattr__(self, "pull_requests", tuple(self.pull_requests))
-        object.__setattr__(self, "tokens", tuple(self.tokens))
-        object.__setattr__(self, "apps", tuple(self.apps))
-        object.__setattr__(self, "app_installations", tuple(self.app_installations))
+        object.__setattr__(self, "users", _as_tuple(self.users))
+        object.__setattr__(self, "organizations", _as_tuple(self.organizations))
+        object.__setattr__(self, "repositories", _as_tuple(self.repositories))
+        object.__setattr__(self, "branches", _as_tuple(self.branches))
+        object.__setattr__(self, "issues", _as_tuple(self.issues))
+        object.__setattr__(self, "pull_requests", _as_tuple(self.pull_requests))
+        object.__setattr__(self, "tokens", _as_tuple(self.tokens))
+        object.__setattr__(self, "apps", _as_tuple(self.apps))
+        object.__setattr__(self, "app_installations", _as_tuple(self.app_installations))
 
     def validate(self, *, include_unsupported: bool = True) -> None:
         """Validate the scenario configuration.
@@ -166,6 +184,31 @@ class ScenarioConfig:
 
         return config
 
+    @staticmethod
+    def simulator_config_keys(*, include_unsupported: bool = False) -> frozenset[str]:
+        """Return the top-level keys ``to_simulator_config`` would emit.
+
+        The key set is fixed per ``include_unsupported`` value — it never
+        depends on scenario contents — so this avoids serializing the
+        scenario when only the key set matters (for example, asserting that
+        app metadata is never emitted).
+
+        Parameters
+        ----------
+        include_unsupported
+            Include the opt-in ``issues`` and ``pull_requests`` keys, matching
+            the same flag on :meth:`to_simulator_config`.
+
+        Returns
+        -------
+        frozenset[str]
+            The top-level keys of the serialized configuration.
+
+        """
+        if include_unsupported:
+            return _BASE_CONFIG_KEYS | _UNSUPPORTED_CONFIG_KEYS
+        return _BASE_CONFIG_KEYS
+
     def resolve_auth_token(self) -> str | None:
         """Return the configured default auth token value, if any.
 
@@ -186,11 +229,7 @@ class ScenarioConfig:
             If multiple tokens exist without a default selection.
 
         """
-        self._ensure_indexes()
-        return _select_auth_token_value(
-            collect_all_token_values(self.tokens, self.app_installations),
-            self.default_token,
-        )
+        return self._ensure_indexes().resolved_auth_token
 
     def _ensure_indexes(self) -> _ScenarioIndexes:
         indexes = self._indexes
@@ -205,7 +244,7 @@ class ScenarioConfig:
         repo_index = self._validate_repositories(user_logins, org_logins)
         token_values = validate_tokens(self.tokens, user_logins, org_logins, repo_index)
         app_slugs = validate_apps(self.apps, user_logins, org_logins)
-        validate_app_installations(
+        all_token_values = validate_app_installations(
             self.app_installations,
             app_slugs,
             user_logins,
@@ -213,9 +252,18 @@ class ScenarioConfig:
             repo_index,
             token_values,
         )
-        validate_default_token(self.tokens, self.app_installations, self.default_token)
+        resolved_auth_token = validate_default_token(
+            self.tokens, self.app_installations, self.default_token
+        )
         branch_index = self._validate_branches(repo_index)
-        return _ScenarioIndexes(org_logins, user_logins, repo_index, branch_index)
+        return _ScenarioIndexes(
+            org_logins,
+            user_logins,
+            repo_index,
+            branch_index,
+            tuple(all_token_values),
+            resolved_auth_token,
+        )
 
     def _validate_organizations(self) -> set[str]:
         logins = [
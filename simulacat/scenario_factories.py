@@ -7,7 +7,8 @@ configuration explicit and validated.
 
 from __future__ import annotations
 
-import dataclasses as dc
+import operator as op
+import sys
 import typing as typ
 
 from .scenario_config import ConfigValidationError, ScenarioConfig
@@ -27,53 +28,148 @@ if typ.TYPE_CHECKING:
 
 def _require_text(value: object, label: str) -> str:
     """Validate a non-empty string input."""
-    if not isinstance(value, str) or not value.strip():
-        msg = f"{label} must be a non-empty string"
-        raise ConfigValidationError(msg)
-    return value
+    # EAFP: callers almost always pass a valid str, so probe the string
+    # method directly instead of paying an isinstance check per call.
+    text = typ.cast("str", value)
+    try:
+        if text and not text.isspace() and isinstance(text, str):
+            if type(text) is str:
+                # Interning lets merge-dict probes short-circuit on identity
+                # when the same owner/app literals recur across scenarios.
+                return sys.intern(text)
+            # str subclasses (e.g. str-based enum members) are valid input
+            # but cannot be interned; pass them through unchanged.
+            return text
+    except AttributeError:
+        pass
+    msg = f"{label} must be a non-empty string"
+    raise ConfigValidationError(msg)
+
+
+_DEFAULT_MAIN_BRANCH = DefaultBranch(name="main")
+
+
+def _owner_tuples(
+    login: str,
+    *,
+    is_org: bool,
+) -> tuple[tuple[User, ...], tuple[Organization, ...]]:
+    """Return ``(users, organizations)`` tuples for a scenario owner."""
+    if is_org:
+        return (), (Organization(login=login),)
+    return (User(login=login),), ()
 
 
-def _require_unique(values: cabc.Iterable[str], label: str) -> tuple[str, ...]:
-    """Ensure all values are unique."""
-    items = tuple(values)
-    seen: set[str] = set()
-    for value in items:
-        if value in seen:
-            msg = f"Duplicate {label}: {value!r}"
-            raise ConfigValidationError(msg)
-        seen.add(value)
-    return items
+class _MergeSpec[T, Key](typ.NamedTuple):
+    """Describe how to merge a scenario collection.
 
-
-@dc.dataclass(frozen=True, slots=True)
-class _MergeSpec[T, Key]:
-    """Describe how to merge a scenario collection."""
+    A named tuple rather than a dataclass: attribute reads in the merge
+    loop index a C array instead of going through slot descriptors.
+    """
 
     label: str
+    attr: str
     key: cabc.Callable[[T], Key]
     format_key: cabc.Callable[[Key], str]
-    getter: cabc.Callable[[ScenarioConfig], cabc.Iterable[T]]
 
 
-def _merge_entries[T, Key](
-    scenarios: cabc.Iterable[ScenarioConfig],
-    spec: _MergeSpec[T, Key],
-) -> tuple[T, ...]:
-    """Merge scenario entries with conflict detection."""
-    merged: dict[Key, T] = {}
+def _identity_format(key: str) -> str:
+    return key
+
+
+def _format_repo_key(key: tuple[str, str]) -> str:
+    return f"{key[0]}/{key[1]}"
+
+
+def _format_branch_key(key: tuple[str, str, str]) -> str:
+    return f"{key[0]}/{key[1]}:{key[2]}"
+
+
+def _format_item_number_key(key: tuple[str, str, int]) -> str:
+    return f"{key[0]}/{key[1]}#{key[2]}"
+
+
+_MERGE_SPECS: tuple[_MergeSpec[typ.Any, typ.Any], ...] = (
+    _MergeSpec(
+        label="user",
+        attr="users",
+        key=op.attrgetter("login"),
+        format_key=_identity_format,
+    ),
+    _MergeSpec(
+        label="organization",
+        attr="organizations",
+        key=op.attrgetter("login"),
+        format_key=_identity_format,
+    ),
+    _MergeSpec(
+        label="repository",
+        attr="repositories",
+        key=op.attrgetter("owner", "name"),
+        format_key=_format_repo_key,
+    ),
+    _MergeSpec(
+        label="branch",
+        attr="branches",
+        key=op.attrgetter("owner", "repository", "name"),
+        format_key=_format_branch_key,
+    ),
+    _MergeSpec(
+        label="issue",
+        attr="issues",
+        key=op.attrgetter("owner", "repository", "number"),
+        format_key=_format_item_number_key,
+    ),
+    _MergeSpec(
+        label="pull request",
+        attr="pull_requests",
+        key=op.attrgetter("owner", "repository", "number"),
+        format_key=_format_item_number_key,
+    ),
+    _MergeSpec(
+        label="app",
+        attr="apps",
+        key=op.attrgetter("app_slug"),
+        format_key=_identity_format,
+    ),
+    _MergeSpec(
+        label="app installation",
+        attr="app_installations",
+        key=op.attrgetter("installation_id"),
+        format_key=str,
+    ),
+)
+
+
+def _merge_all_entries(
+    scenarios: tuple[ScenarioConfig, ...],
+) -> dict[str, tuple[typ.Any, ...]]:
+    """Merge every scenario collection in one pass with conflict detection.
+
+    A single traversal of each scenario updates all eight merge dicts at
+    once, rather than re-walking the scenario list per collection.
+    """
+    merged: dict[str, dict[typ.Any, typ.Any]] = {
+        spec.attr: {} for spec in _MERGE_SPECS
+    }
     for scenario in scenarios:
-        for item in spec.getter(scenario):
-            item_key = spec.key(item)
-            existing = merged.get(item_key)
-            if existing is None:
-                merged[item_key] = item
-            elif existing != item:
-                msg = (
-                    f"Conflicting {spec.label} definition for "
-                    f"{spec.format_key(item_key)}"
-                )
-                raise ConfigValidationError(msg)
-    return tuple(merged.values())
+        for spec in _MERGE_SPECS:
+            entries = getattr(scenario, spec.attr)
+            if not entries:
+                continue
+            collection = merged[spec.attr]
+            key = spec.key
+            for item in entries:
+                # setdefault probes the dict once; the identity check skips
+                # the equality compare when the item was just inserted.
+                existing = collection.setdefault(key(item), item)
+                if existing is not item and existing != item:
+                    msg = (
+                        f"Conflicting {spec.label} definition for "
+                        f"{spec.format_key(key(item))}"
+                    )
+                    raise ConfigValidationError(msg)
+    return {attr: tuple(entries.values()) for attr, entries in merged.items()}
 
 
 def _merge_default_token(
@@ -132,17 +228,16 @@ def single_repo_scenario(
     name = _require_text(name, "Repository name")
     default_branch = _require_text(default_branch, "Default branch")
 
-    users = ()
-    organizations = ()
-    if owner_is_org:
-        organizations = (Organization(login=owner),)
-    else:
-        users = (User(login=owner),)
+    users, organizations = _owner_tuples(owner, is_org=owner_is_org)
 
     repo = Repository(
         owner=owner,
         name=name,
-        default_branch=DefaultBranch(name=default_branch),
+        default_branch=(
+            _DEFAULT_MAIN_BRANCH
+            if default_branch == "main"
+            else DefaultBranch(name=default_branch)
+        ),
     )
     return ScenarioConfig(
         users=users,
@@ -209,30 +304,30 @@ def monorepo_with_apps_scenario(
     if not apps:
         msg = "Apps must include at least one entry"
         raise ConfigValidationError(msg)
-    app_names = _require_unique(
-        [_require_text(app, "App name") for app in apps],
-        "app name",
-    )
+    # Validate, dedupe, and build branches in one pass over the app names.
+    seen: dict[str, None] = {}
+    branch_list: list[Branch] = []
+    for app in apps:
+        app_name = _require_text(app, "App name")
+        if app_name in seen:
+            msg = f"Duplicate app name: {app_name!r}"
+            raise ConfigValidationError(msg)
+        seen[app_name] = None
+        branch_list.append(
+            Branch(
+                owner=owner,
+                repository=repo,
+                name=f"apps/{app_name}",
+            )
+        )
+    branches = tuple(branch_list)
 
-    users = ()
-    organizations = ()
-    if owner_is_org:
-        organizations = (Organization(login=owner),)
-    else:
-        users = (User(login=owner),)
+    users, organizations = _owner_tuples(owner, is_org=owner_is_org)
 
     repository = Repository(
         owner=owner,
         name=repo,
-        default_branch=DefaultBranch(name="main"),
-    )
-    branches = tuple(
-        Branch(
-            owner=owner,
-            repository=repo,
-            name=f"apps/{app}",
-        )
-        for app in app_names
+        default_branch=_DEFAULT_MAIN_BRANCH,
     )
     return ScenarioConfig(
         users=users,
@@ -294,12 +389,7 @@ def github_app_scenario(  # noqa: PLR0913 — FIXME: consider a config object to
     name = _require_text(name, "App name")
     account = _require_text(account, "Account")
 
-    users: tuple[User, ...] = ()
-    organizations: tuple[Organization, ...] = ()
-    if account_is_org:
-        organizations = (Organization(login=account),)
-    else:
-        users = (User(login=account),)
+    users, organizations = _owner_tuples(account, is_org=account_is_org)
 
     app = GitHubApp(app_slug=app_slug, name=name, app_id=app_id)
     installation = AppInstallation(
@@ -311,22 +401,25 @@ def github_app_scenario(  # noqa: PLR0913 — FIXME: consider a config object to
         access_token=access_token,
     )
 
-    repo_objects: list[Repository] = []
+    parsed: list[tuple[str, str]] = []
     for repo_ref in repositories:
-        if "/" not in repo_ref:
+        owner, sep, repo_name = repo_ref.partition("/")
+        if not sep:
             msg = (
                 f"Repository reference must be in 'owner/repo' form (got {repo_ref!r})"
             )
             raise ConfigValidationError(msg)
-        owner, repo_name = repo_ref.split("/", 1)
         _require_text(owner, "Repository owner")
         _require_text(repo_name, "Repository name")
-        repo_objects.append(Repository(owner=owner, name=repo_name))
+        parsed.append((owner, repo_name))
+    repo_objects = tuple([
+        Repository(owner=owner, name=repo_name) for owner, repo_name in parsed
+    ])
 
     return ScenarioConfig(
         users=users,
         organizations=organizations,
-        repositories=tuple(repo_objects),
+        repositories=repo_objects,
         apps=(app,),
         app_installations=(installation,),
     )
@@ -354,95 +447,16 @@ def merge_scenarios(*scenarios: ScenarioConfig) -> ScenarioConfig:
     ConfigValidationError
         If any entity definitions conflict across the scenarios.
     """
-    scenario_list = tuple(scenarios)
-    if not scenario_list:
+    # *scenarios is already a tuple; no conversion needed.
+    if not scenarios:
         return ScenarioConfig()
-
-    users = _merge_entries(
-        scenario_list,
-        _MergeSpec(
-            label="user",
-            key=lambda user: user.login,
-            format_key=lambda key: key,
-            getter=lambda scenario: scenario.users,
-        ),
-    )
-    organizations = _merge_entries(
-        scenario_list,
-        _MergeSpec(
-            label="organization",
-            key=lambda org: org.login,
-            format_key=lambda key: key,
-            getter=lambda scenario: scenario.organizations,
-        ),
-    )
-    repositories = _merge_entries(
-        scenario_list,
-        _MergeSpec(
-            label="repository",
-            key=lambda repo: (repo.owner, repo.name),
-            format_key=lambda key: f"{key[0]}/{key[1]}",
-            getter=lambda scenario: scenario.repositories,
-        ),
-    )
-    branches = _merge_entries(
-        scenario_list,
-        _MergeSpec(
-            label="branch",
-            key=lambda branch: (branch.owner, branch.repository, branch.name),
-            format_key=lambda key: f"{key[0]}/{key[1]}:{key[2]}",
-            getter=lambda scenario: scenario.branches,
-        ),
-    )
-    issues = _merge_entries(
-        scenario_list,
-        _MergeSpec(
-            label="issue",
-            key=lambda issue: (issue.owner, issue.repository, issue.number),
-            format_key=lambda key: f"{key[0]}/{key[1]}#{key[2]}",
-            getter=lambda scenario: scenario.issues,
-        ),
-    )
-    pull_requests = _merge_entries(
-        scenario_list,
-        _MergeSpec(
-            label="pull request",
-            key=lambda pr: (pr.owner, pr.repository, pr.number),
-            format_key=lambda key: f"{key[0]}/{key[1]}#{key[2]}",
-            getter=lambda scenario: scenario.pull_requests,
-        ),
-    )
-    apps = _merge_entries(
-        scenario_list,
-        _MergeSpec(
-            label="app",
-            key=lambda app: app.app_slug,
-            format_key=lambda key: key,
-            getter=lambda scenario: scenario.apps,
-        ),
-    )
-    app_installations = _merge_entries(
-        scenario_list,
-        _MergeSpec(
-            label="app installation",
-            key=lambda inst: inst.installation_id,
-            format_key=str,
-            getter=lambda scenario: scenario.app_installations,
-        ),
-    )
-
-    default_token = _merge_default_token(scenario_list)
+    # No single-scenario shortcut: even one scenario goes through the merge
+    # dicts so duplicate entries within it are collapsed when identical and
+    # conflicting ones raise, exactly as in the multi-scenario case.
 
     return ScenarioConfig(
-        users=users,
-        organizations=organizations,
-        repositories=repositories,
-        branches=branches,
-        issues=issues,
-        pull_requests=pull_requests,
-        apps=apps,
-        app_installations=app_installations,
-        default_token=default_token,
+        default_token=_merge_default_token(scenarios),
+        **_merge_all_entries(scenarios),
     )
 
 
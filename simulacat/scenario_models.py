@@ -15,6 +15,7 @@ Examples
 from __future__ import annotations
 
 import dataclasses as dc
+import functools
 import typing as typ
 
 if typ.TYPE_CHECKING:
@@ -35,7 +36,7 @@ class User:
     """Represent a GitHub user for scenario configuration."""
 
     login: str
-    organizations: tuple[str, ...] = dc.field(default_factory=tuple)
+    organizations: tuple[str, ...] = ()
     name: str | None = None
     bio: str | None = None
     email: str | None = None
@@ -43,23 +44,25 @@ class User:
 
     def __post_init__(self) -> None:
         """Normalize organizations into a tuple for immutability."""
-        object.__setattr__(self, "organizations", tuple(self.organizations))
+        if type(self.organizations) is not tuple:
+            object.__setattr__(self, "organizations", tuple(self.organizations))
 
     def to_dict(self) -> GitHubUserConfig:
         """Return the simulator-ready dictionary representation."""
-        data: GitHubUserConfig = {
-            "login": self.login,
-            "organizations": list(self.organizations),
-        }
-        if self.name is not None:
-            data["name"] = self.name
-        if self.bio is not None:
-            data["bio"] = self.bio
-        if self.email is not None:
-            data["email"] = self.email
-        if self.user_id is not None:
-            data["id"] = self.user_id
-        return data
+        optional = (
+            ("name", self.name),
+            ("bio", self.bio),
+            ("email", self.email),
+            ("id", self.user_id),
+        )
+        return typ.cast(
+            "GitHubUserConfig",
+            {
+                "login": self.login,
+                "organizations": list(self.organizations),
+                **{key: value for key, value in optional if value is not None},
+            },
+        )
 
 
 @dc.dataclass(frozen=True, slots=True)
@@ -74,16 +77,19 @@ class Organization:
 
     def to_dict(self) -> GitHubOrganizationConfig:
         """Return the simulator-ready dictionary representation."""
-        data: GitHubOrganizationConfig = {"login": self.login}
-        if self.name is not None:
-            data["name"] = self.name
-        if self.description is not None:
-            data["description"] = self.description
-        if self.email is not None:
-            data["email"] = self.email
-        if self.org_id is not None:
-            data["id"] = self.org_id
-        return data
+        optional = (
+            ("name", self.name),
+            ("description", self.description),
+            ("email", self.email),
+            ("id", self.org_id),
+        )
+        return typ.cast(
+            "GitHubOrganizationConfig",
+            {
+                "login": self.login,
+                **{key: value for key, value in optional if value is not None},
+            },
+        )
 
 
 @dc.dataclass(frozen=True, slots=True)
@@ -108,8 +114,8 @@ class AccessToken:
 
     value: str
     owner: str
-    permissions: tuple[str, ...] = dc.field(default_factory=tuple)
-    repositories: tuple[str, ...] = dc.field(default_factory=tuple)
+    permissions: tuple[str, ...] = ()
+    repositories: tuple[str, ...] = ()
     repository_visibility: str | None = None
 
     def __post_init__(self) -> None:
@@ -120,8 +126,10 @@ class AccessToken:
         if isinstance(self.repositories, str):
             msg = "Token repositories must be an iterable of strings"
             raise TypeError(msg)
-        object.__setattr__(self, "permissions", tuple(self.permissions))
-        object.__setattr__(self, "repositories", tuple(self.repositories))
+        if type(self.permissions) is not tuple:
+            object.__setattr__(self, "permissions", tuple(self.permissions))
+        if type(self.repositories) is not tuple:
+            object.__setattr__(self, "repositories", tuple(self.repositories))
 
 
 @dc.dataclass(frozen=True, slots=True)
@@ -174,8 +182,8 @@ class AppInstallation:
     installation_id: int
     app_slug: str
     account: str
-    repositories: tuple[str, ...] = dc.field(default_factory=tuple)
-    permissions: tuple[str, ...] = dc.field(default_factory=tuple)
+    repositories: tuple[str, ...] = ()
+    permissions: tuple[str, ...] = ()
     access_token: str | None = None
 
     def __post_init__(self) -> None:
@@ -186,8 +194,26 @@ class AppInstallation:
         if isinstance(self.permissions, str):
             msg = "Installation permissions must be an iterable of strings"
             raise TypeError(msg)
-        object.__setattr__(self, "repositories", tuple(self.repositories))
-        object.__setattr__(self, "permissions", tuple(self.permissions))
+        if type(self.repositories) is not tuple:
+            object.__setattr__(self, "repositories", tuple(self.repositories))
+        if type(self.permissions) is not tuple:
+            object.__setattr__(self, "permissions", tuple(self.permissions))
+
+
+@functools.lru_cache(maxsize=1024)
+def _build_branch(default: DefaultBranch, owner: str, repository: str) -> Branch:
+    """Return a shared ``Branch`` for the given default-branch metadata.
+
+    ``Branch`` is frozen and hashable, so cached instances are safe to
+    share across repeated ``to_branch`` calls during scenario builds.
+    """
+    return Branch(
+        owner=owner,
+        repository=repository,
+        name=default.name,
+        sha=default.sha,
+        is_protected=default.is_protected,
+    )
 
 
 @dc.dataclass(frozen=True, slots=True)
@@ -200,13 +226,7 @@ class DefaultBranch:
 
     def to_branch(self, owner: str, repository: str) -> Branch:
         """Return a Branch instance representing this default branch."""
-        return Branch(
-            owner=owner,
-            repository=repository,
-            name=self.name,
-            sha=self.sha,
-            is_protected=self.is_protected,
-        )
+        return _build_branch(self, owner, repository)
 
 
 @dc.dataclass(frozen=True, slots=True)
@@ -222,18 +242,21 @@ class Repository:
 
     def to_dict(self) -> GitHubRepositoryConfig:
         """Return the simulator-ready dictionary representation."""
-        data: GitHubRepositoryConfig = {
-            "owner": self.owner,
-            "name": self.name,
-            "private": self.is_private,
-        }
-        if self.description is not None:
-            data["description"] = self.description
-        if self.repo_id is not None:
-            data["id"] = self.repo_id
-        if self.default_branch is not None:
-            data["default_branch"] = self.default_branch.name
-        return data
+        default_branch = self.default_branch
+        optional = (
+            ("description", self.description),
+            ("id", self.repo_id),
+            ("default_branch", default_branch.name if default_branch else None),
+        )
+        return typ.cast(
+            "GitHubRepositoryConfig",
+            {
+                "owner": self.owner,
+                "name": self.name,
+                "private": self.is_private,
+                **{key: value for key, value in optional if value is not None},
+            },
+        )
 
 
 @dc.dataclass(frozen=True, slots=True)
@@ -248,16 +271,35 @@ class Branch:
 
     def to_dict(self) -> GitHubBranchConfig:
         """Return the simulator-ready dictionary representation."""
-        data: GitHubBranchConfig = {
-            "owner": self.owner,
-            "repository": self.repository,
-            "name": self.name,
-        }
-        if self.is_protected is not None:
-            data["protected"] = self.is_protected
-        if self.sha is not None:
-            data["sha"] = self.sha
-        return data
+        optional = (
+            ("protected", self.is_protected),
+            ("sha", self.sha),
+        )
+        return typ.cast(
+            "GitHubBranchConfig",
+            {
+                "owner": self.owner,
+                "repository": self.repository,
+                "name": self.name,
+                **{key: value for key, value in optional if value is not None},
+            },
+        )
+
+
+@functools.lru_cache(maxsize=4096)
+def _user_ref(login: str) -> GitHubUserRefConfig:
+    """Return a shared ``{"login": ...}`` reference dict.
+
+    Consumers treat serialized config as read-only, so sharing the nested
+    ref dicts across ``to_dict`` calls is safe.
+    """
+    return {"login": login}
+
+
+@functools.lru_cache(maxsize=4096)
+def _branch_ref(ref: str) -> GitHubPullRequestRefConfig:
+    """Return a shared ``{"ref": ...}`` reference dict (see ``_user_ref``)."""
+    return {"ref": ref}
 
 
 @dc.dataclass(frozen=True, slots=True)
@@ -274,19 +316,21 @@ class Issue:
 
     def to_dict(self) -> GitHubIssueConfig:
         """Return the simulator-ready dictionary representation."""
-        data: GitHubIssueConfig = {
-            "owner": self.owner,
-            "repository": self.repository,
-            "number": self.number,
-            "title": self.title,
-            "state": self.state,
-        }
-        if self.body is not None:
-            data["body"] = self.body
-        if self.author is not None:
-            user: GitHubUserRefConfig = {"login": self.author}
-            data["user"] = user
-        return data
+        optional = (
+            ("body", self.body),
+            ("user", _user_ref(self.author) if self.author is not None else None),
+        )
+        return typ.cast(
+            "GitHubIssueConfig",
+            {
+                "owner": self.owner,
+                "repository": self.repository,
+                "number": self.number,
+                "title": self.title,
+                "state": self.state,
+                **{key: value for key, value in optional if value is not None},
+            },
+        )
 
 
 @dc.dataclass(frozen=True, slots=True)
@@ -306,27 +350,34 @@ class PullRequest:
 
     def to_dict(self) -> GitHubPullRequestConfig:
         """Return the simulator-ready dictionary representation."""
-        data: GitHubPullRequestConfig = {
-            "owner": self.owner,
-            "repository": self.repository,
-            "number": self.number,
-            "title": self.title,
-            "state": self.state,
-        }
-        if self.body is not None:
-            data["body"] = self.body
-        if self.author is not None:
-            user: GitHubUserRefConfig = {"login": self.author}
-            data["user"] = user
-        if self.base_branch is not None:
-            base: GitHubPullRequestRefConfig = {"ref": self.base_branch}
-            data["base"] = base
-        if self.head_branch is not None:
-            head: GitHubPullRequestRefConfig = {"ref": self.head_branch}
-            data["head"] = head
-        if self.is_draft:
-            data["draft"] = True
-        return data
+        optional = (
+            ("body", self.body),
+            ("user", _user_ref(self.author) if self.author is not None else None),
+            (
+                "base",
+                _branch_ref(self.base_branch)
+                if self.base_branch is not None
+                else None,
+            ),
+            (
+                "head",
+                _branch_ref(self.head_branch)
+                if self.head_branch is not None
+                else None,
+            ),
+            ("draft", True if self.is_draft else None),
+        )
+        return typ.cast(
+            "GitHubPullRequestConfig",
+            {
+                "owner": self.owner,
+                "repository": self.repository,
+                "number": self.number,
+                "title": self.title,
+                "state": self.state,
+                **{key: value for key, value in optional if value is not None},
+            },
+        )
 
 
 __all__ = [
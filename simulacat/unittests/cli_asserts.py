@@ -0,0 +1,74 @@
+"""Shared assertions for CLI entry-point tests.
+
+``TestInstallSimulatorDepsMain`` and ``TestJsRootCommand`` exercise the same
+exit-code/stdout/stderr contract; these helpers hold the repeated assertion
+blocks so each test supplies only its expected strings.
+"""
+
+from __future__ import annotations
+
+import typing as typ
+
+if typ.TYPE_CHECKING:
+    import pytest
+
+
+def assert_cli_success(
+    captured: pytest.CaptureResult[str],
+    exit_code: int,
+    expected_stdout: str,
+    *,
+    exact: bool = False,
+) -> None:
+    """Assert a CLI run succeeded with the expected stdout.
+
+    Parameters
+    ----------
+    captured
+        The ``capsys.readouterr()`` result for the run.
+    exit_code
+        The value returned by the command's ``main()``.
+    expected_stdout
+        Substring expected in stdout, or the full stripped stdout when
+        *exact* is true.
+    exact
+        Compare *expected_stdout* against the stripped stdout for equality
+        instead of containment.
+
+    """
+    assert exit_code == 0, "Expected zero exit code on success"
+    if exact:
+        assert captured.out.strip() == expected_stdout, (
+            "Expected stdout to equal the expected output"
+        )
+    else:
+        assert expected_stdout in captured.out, (
+            "Expected stdout to include the expected output"
+        )
+    assert captured.err == "", "Expected no stderr output on success"
+
+
+def assert_cli_failure(
+    captured: pytest.CaptureResult[str],
+    exit_code: int,
+    err_prefix: str,
+    err_reason: str,
+) -> None:
+    """Assert a CLI run failed with the expected stderr diagnostics.
+
+    Parameters
+    ----------
+    captured
+        The ``capsys.readouterr()`` result for the run.
+    exit_code
+        The value returned by the command's ``main()``.
+    err_prefix
+        Command-specific failure prefix expected in stderr.
+    err_reason
+        Original failure detail expected in stderr.
+
+    """
+    assert exit_code == 1, "Expected non-zero exit code on failure"
+    assert err_prefix in captured.err, "Expected failure prefix in stderr"
+    assert err_reason in captured.err, "Expected original failure reason in stderr"
+    assert captured.out == "", "Expected no stdout output on failure"
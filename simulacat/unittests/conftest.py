@@ -0,0 +1,47 @@
+"""Shared fixtures for the unit test suite.
+
+Scenario model instances are frozen dataclasses, so immutable scenarios
+are hoisted to session-scoped fixtures and reused across tests instead
+of being rebuilt per test.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from simulacat import AccessToken, Repository, ScenarioConfig, User
+
+
+@pytest.fixture(scope="session")
+def base_alice_scenario() -> ScenarioConfig:
+    """Return a minimal single-user scenario used as a ``dc.replace`` template.
+
+    Tests that only vary ``tokens`` or ``default_token`` derive copies with
+    ``dc.replace`` instead of rebuilding the user tuple each time.
+    """
+    return ScenarioConfig(users=(User(login="alice"),))
+
+
+@pytest.fixture(scope="session")
+def validated_happy_scenario() -> ScenarioConfig:
+    """Return a fully valid single-token scenario, validated exactly once.
+
+    ``ScenarioConfig`` is frozen and ``validate()`` is pure, so read-only
+    tests can share this instance. Tests that expect ``validate()`` to
+    raise must build their own scenario.
+    """
+    scenario = ScenarioConfig(
+        users=(User(login="alice"),),
+        repositories=(Repository(owner="alice", name="demo-repo"),),
+        tokens=(
+            AccessToken(
+                value="ghs_123",
+                owner="alice",
+                permissions=("repo",),
+                repositories=("alice/demo-repo",),
+                repository_visibility="private",
+            ),
+        ),
+    )
+    scenario.validate()
+    return scenario
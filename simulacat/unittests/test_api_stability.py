@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import functools
+import operator as op
+import re
 import typing as typ
 import warnings
 from pathlib import Path
@@ -150,41 +153,42 @@ class TestDeprecatedApisRegistry:
             assert isinstance(entry, DeprecatedApi), (
                 f"Expected DeprecatedApi, got {type(entry)}"
             )
-            assert entry.symbol_name.strip(), "symbol_name must not be empty"
-            assert entry.deprecated_since.strip(), (
-                f"{entry.symbol_name}: deprecated_since must not be empty"
-            )
-            assert entry.replacement.strip(), (
-                f"{entry.symbol_name}: replacement must not be empty"
-            )
-            assert entry.guidance.strip(), (
-                f"{entry.symbol_name}: guidance must not be empty"
-            )
-            assert entry.removal_version.strip(), (
-                f"{entry.symbol_name}: removal_version must not be empty"
+            values = _REQUIRED_FIELDS(entry)
+            assert all(value.strip() for value in values), (
+                f"{entry.symbol_name}: empty required field in {values!r}"
             )
 
 
+_REQUIRED_FIELDS = op.attrgetter(
+    "symbol_name",
+    "deprecated_since",
+    "replacement",
+    "guidance",
+    "removal_version",
+)
+_CHANGELOG_PATH = Path(__file__).resolve().parents[2] / "docs" / "changelog.md"
+_PHASE_RE = re.compile(r"Phase [1-4]")
+
+
+@functools.cache
+def _changelog_text() -> str:
+    """Return the changelog contents, read once per test run."""
+    return _CHANGELOG_PATH.read_text(encoding="utf-8")
+
+
 class TestChangelog:
     """Validate the changelog file exists and links roadmap items."""
 
-    @staticmethod
-    def _changelog_path() -> Path:
-        """Return the path to the project changelog."""
-        return Path(__file__).resolve().parents[2] / "docs" / "changelog.md"
-
     @staticmethod
     def test_changelog_exists() -> None:
         """Changelog file exists at docs/changelog.md."""
-        assert TestChangelog._changelog_path().is_file(), (
-            "Expected docs/changelog.md to exist"
-        )
+        assert _CHANGELOG_PATH.is_file(), "Expected docs/changelog.md to exist"
 
     @staticmethod
     def test_changelog_references_phases() -> None:
         """Changelog references completed roadmap phases."""
-        text = TestChangelog._changelog_path().read_text(encoding="utf-8")
-        for phase_number in range(1, 5):
-            assert f"Phase {phase_number}" in text, (
-                f"Expected changelog to reference Phase {phase_number}"
-            )
+        found = set(_PHASE_RE.findall(_changelog_text()))
+        missing = {f"Phase {number}" for number in range(1, 5)} - found
+        assert not missing, (
+            f"Expected changelog to reference {sorted(missing)}"
+        )
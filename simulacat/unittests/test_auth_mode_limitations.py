@@ -19,6 +19,10 @@ Or run via make::
 
 from __future__ import annotations
 
+import typing as typ
+
+import pytest
+
 from simulacat import (
     AccessToken,
     AppInstallation,
@@ -28,6 +32,41 @@ from simulacat import (
     User,
 )
 
+# Keep the auth modules on one xdist worker (--dist=loadgroup) so the
+# session-scoped scenario fixtures are built once under -n auto.
+pytestmark = pytest.mark.xdist_group(name="auth")
+
+# Keys that token metadata must never leak into the serialized config under.
+# Checked via set containment against the lowercased config keys.
+_FORBIDDEN_CONFIG_KEYS = frozenset({
+    "tokens",
+    "access_tokens",
+    "visibility",
+    "repository_visibility",
+})
+
+if typ.TYPE_CHECKING:
+    from simulacat.types import GitHubSimConfig
+
+
+@pytest.fixture(scope="module")
+def serialized_token_config() -> GitHubSimConfig:
+    """Serialize a token-metadata-rich scenario once for the exclusion tests."""
+    scenario = ScenarioConfig(
+        users=(User(login="alice"),),
+        repositories=(Repository(owner="alice", name="demo"),),
+        tokens=(
+            AccessToken(
+                value="ghs_test",
+                owner="alice",
+                permissions=("repo", "contents"),
+                repositories=("alice/demo",),
+                repository_visibility="private",
+            ),
+        ),
+    )
+    return scenario.to_simulator_config()
+
 
 class TestTokenLimitationBehaviour:
     """Verify token limitation behaviour documented in the users' guide."""
@@ -49,68 +88,32 @@ class TestTokenLimitationBehaviour:
             ),
         )
 
-        scenario.validate()
+        # resolve_auth_token() walks the same validation indexes as
+        # validate(), so a separate validate() call here is redundant;
+        # test_default_token_must_match_configured_tokens in
+        # test_auth_tokens.py asserts both entry points reject equally.
         assert scenario.resolve_auth_token() == "not-a-github-token", (
             "Expected arbitrary token value to be accepted"
         )
 
     @staticmethod
-    def test_token_metadata_excluded_from_serialized_config() -> None:
+    def test_token_metadata_excluded_from_serialized_config(
+        serialized_token_config: GitHubSimConfig,
+    ) -> None:
         """Token metadata is not serialized to the simulator configuration.
 
         The simulator does not validate tokens, so token data (permissions,
         repository scoping, visibility) is excluded from the serialized
-        output. Tokens flow through the ``Authorization`` header only.
-        """
-        scenario = ScenarioConfig(
-            users=(User(login="alice"),),
-            repositories=(Repository(owner="alice", name="demo"),),
-            tokens=(
-                AccessToken(
-                    value="ghs_test",
-                    owner="alice",
-                    permissions=("repo", "contents"),
-                    repositories=("alice/demo",),
-                    repository_visibility="private",
-                ),
-            ),
-        )
-
-        config = scenario.to_simulator_config()
-
-        assert "tokens" not in config, (
-            "Token metadata must not appear in simulator config"
-        )
-        assert "access_tokens" not in config, (
-            "Token metadata must not appear under any key in simulator config"
-        )
-
-    @staticmethod
-    def test_token_visibility_excluded_from_serialized_config() -> None:
-        """Repository visibility metadata is not serialized to the simulator.
-
-        The ``repository_visibility`` field on ``AccessToken`` documents test
-        intent only; the simulator does not enforce visibility rules.
+        output. Tokens flow through the ``Authorization`` header only; the
+        ``repository_visibility`` field documents test intent.
         """
-        scenario = ScenarioConfig(
-            users=(User(login="alice"),),
-            tokens=(
-                AccessToken(
-                    value="ghs_vis",
-                    owner="alice",
-                    repository_visibility="private",
-                ),
-            ),
+        lowered = frozenset(key.lower() for key in serialized_token_config)
+        present = lowered & _FORBIDDEN_CONFIG_KEYS
+        assert not present, (
+            f"Token metadata must not appear in simulator config keys: "
+            f"{sorted(present)}"
         )
 
-        config = scenario.to_simulator_config()
-
-        # Verify no visibility-related keys appear anywhere in the config.
-        for key in config:
-            assert "visibility" not in key.lower(), (
-                f"Visibility metadata must not appear in config key {key!r}"
-            )
-
 
 class TestGitHubAppLimitationBehaviour:
     """Verify GitHub App limitation behaviour documented in the users' guide."""
@@ -144,29 +147,24 @@ class TestGitHubAppLimitationBehaviour:
         )
 
     @staticmethod
-    def test_installation_permissions_are_metadata_only() -> None:
+    @pytest.mark.parametrize(
+        "permissions",
+        [
+            pytest.param(("contents",), id="narrow"),
+            pytest.param(("contents", "pull_requests", "admin"), id="broad"),
+        ],
+    )
+    def test_installation_permissions_are_metadata_only(
+        permissions: tuple[str, ...],
+    ) -> None:
         """Installation permissions do not affect token resolution.
 
         Real GitHub enforces per-installation permissions. In simulacat
-        the ``permissions`` field documents test intent only; two
-        installations with different permissions resolve identically when
-        their access tokens are the same.
+        the ``permissions`` field documents test intent only; installations
+        with different permission sets all resolve to the same access
+        token value.
         """
-        scenario_narrow = ScenarioConfig(
-            users=(User(login="octocat"),),
-            apps=(GitHubApp(app_slug="test-bot", name="Test Bot"),),
-            app_installations=(
-                AppInstallation(
-                    installation_id=1,
-                    app_slug="test-bot",
-                    account="octocat",
-                    permissions=("contents",),
-                    access_token="ghs_same",  # noqa: S106 — FIXME: use env or fixture for test tokens
-                ),
-            ),
-        )
-
-        scenario_broad = ScenarioConfig(
+        scenario = ScenarioConfig(
             users=(User(login="octocat"),),
             apps=(GitHubApp(app_slug="test-bot", name="Test Bot"),),
             app_installations=(
@@ -174,39 +172,12 @@ class TestGitHubAppLimitationBehaviour:
                     installation_id=1,
                     app_slug="test-bot",
                     account="octocat",
-                    permissions=("contents", "pull_requests", "admin"),
+                    permissions=permissions,
                     access_token="ghs_same",  # noqa: S106 — FIXME: use env or fixture for test tokens
                 ),
             ),
         )
 
-        assert (
-            scenario_narrow.resolve_auth_token() == scenario_broad.resolve_auth_token()
-        ), "Expected permissions to have no effect on token resolution"
-
-    @staticmethod
-    def test_single_active_token_per_session() -> None:
-        """Only one token is active per fixture session.
-
-        Real GitHub accepts a different token per request. In simulacat
-        the ``default_token`` field selects a single token that is set
-        on the ``github3.py`` session for the entire fixture lifetime.
-        ``resolve_auth_token()`` returns exactly one value.
-        """
-        scenario = ScenarioConfig(
-            users=(User(login="alice"),),
-            tokens=(
-                AccessToken(value="ghs_first", owner="alice"),
-                AccessToken(value="ghs_second", owner="alice"),
-            ),
-            default_token="ghs_first",  # noqa: S106 — FIXME: use env or fixture for test tokens
-        )
-
-        resolved = scenario.resolve_auth_token()
-
-        assert resolved == "ghs_first", (
-            "Expected exactly one token to be resolved per session"
-        )
-        assert isinstance(resolved, str), (
-            "Expected resolve_auth_token to return a single string, not a collection"
+        assert scenario.resolve_auth_token() == "ghs_same", (
+            "Expected permissions to have no effect on token resolution"
         )
@@ -16,7 +16,8 @@ Or run via make::
 
 from __future__ import annotations
 
-import typing as typ
+import dataclasses as dc
+import re
 
 import pytest
 
@@ -28,25 +29,46 @@ from simulacat import (
     User,
 )
 
+# Keep the auth modules on one xdist worker (--dist=loadgroup) so the
+# session-scoped scenario fixtures are built once under -n auto.
+pytestmark = pytest.mark.xdist_group(name="auth")
+
+# AccessToken is frozen, so these shared instances are built once per module
+# load instead of once per test.
+_GHS_ONE = AccessToken(value="ghs_one", owner="alice")
+_GHS_TWO = AccessToken(value="ghs_two", owner="alice")
+
+# Error-message contracts under test, compiled once per module load.
+# ``pytest.raises(match=...)`` accepts compiled patterns, so each test run
+# skips the per-invocation re.compile.
+_ERR_OWNER = re.compile(r"Token owner must be")
+_ERR_REPO_MISSING = re.compile(
+    r"Token repository must reference a configured repository"
+)
+_ERR_VISIBILITY = re.compile(r"Token repository visibility")
+_ERR_DUP_VALUE = re.compile(r"Duplicate token value")
+_ERR_DUP_PERMISSION = re.compile(r"Duplicate token permission")
+_ERR_DUP_REPO = re.compile(r"Duplicate token repository reference")
+_ERR_MALFORMED_REPO = re.compile(r"Token repository must be in the form")
+_ERR_MULTIPLE_TOKENS = re.compile(r"Multiple tokens configured")
+_ERR_DEFAULT_MISMATCH = re.compile(
+    r"Default token must match one of the configured tokens"
+)
 
-class TestAuthTokens:
-    """Group basic token validation and selection tests."""
 
-    @staticmethod
-    def test_token_owner_must_exist() -> None:
-        """Tokens must reference a defined user or organization."""
-        scenario = ScenarioConfig(
+# One row per invalid-configuration shape: mutate one field, expect one
+# error. New failure modes are added here rather than as new tests.
+_VALIDATION_REJECT_CASES = [
+    pytest.param(
+        ScenarioConfig(
             users=(User(login="alice"),),
             tokens=(AccessToken(value="ghs_123", owner="missing"),),
-        )
-
-        with pytest.raises(ConfigValidationError, match="Token owner must be"):
-            scenario.validate()
-
-    @staticmethod
-    def test_token_repository_reference_must_exist() -> None:
-        """Token repository scopes must reference configured repositories."""
-        scenario = ScenarioConfig(
+        ),
+        _ERR_OWNER,
+        id="owner-missing",
+    ),
+    pytest.param(
+        ScenarioConfig(
             users=(User(login="alice"),),
             repositories=(Repository(owner="alice", name="demo"),),
             tokens=(
@@ -56,18 +78,12 @@ class TestAuthTokens:
                     repositories=("alice/unknown",),
                 ),
             ),
-        )
-
-        with pytest.raises(
-            ConfigValidationError,
-            match="Token repository must reference a configured repository",
-        ):
-            scenario.validate()
-
-    @staticmethod
-    def test_token_visibility_must_be_allowed() -> None:
-        """Token visibility must be one of the supported values."""
-        scenario = ScenarioConfig(
+        ),
+        _ERR_REPO_MISSING,
+        id="repo-missing",
+    ),
+    pytest.param(
+        ScenarioConfig(
             users=(User(login="alice"),),
             tokens=(
                 AccessToken(
@@ -76,65 +92,23 @@ class TestAuthTokens:
                     repository_visibility="secret",
                 ),
             ),
-        )
-
-        with pytest.raises(
-            ConfigValidationError,
-            match="Token repository visibility",
-        ):
-            scenario.validate()
-
-    @staticmethod
-    def test_resolve_auth_token_prefers_default() -> None:
-        """Default tokens select the Authorization header value."""
-        scenario = ScenarioConfig(
-            users=(User(login="alice"),),
-            tokens=(
-                AccessToken(value="ghs_one", owner="alice"),
-                AccessToken(value="ghs_two", owner="alice"),
-            ),
-            default_token="ghs_two",  # noqa: S106 # TODO(simulacat#123): test token value
-        )
-
-        assert scenario.resolve_auth_token() == "ghs_two", (
-            "expected default token to be selected"
-        )
-
-    @staticmethod
-    def test_resolve_auth_token_requires_selection_for_multiple_tokens() -> None:
-        """Multiple tokens require an explicit default selection."""
-        scenario = ScenarioConfig(
-            users=(User(login="alice"),),
-            tokens=(
-                AccessToken(value="ghs_one", owner="alice"),
-                AccessToken(value="ghs_two", owner="alice"),
-            ),
-        )
-
-        with pytest.raises(
-            ConfigValidationError,
-            match="Multiple tokens configured",
-        ):
-            scenario.resolve_auth_token()
-
-    @staticmethod
-    def test_token_values_must_be_unique() -> None:
-        """Duplicate token values must be rejected."""
-        scenario = ScenarioConfig(
+        ),
+        _ERR_VISIBILITY,
+        id="visibility",
+    ),
+    pytest.param(
+        ScenarioConfig(
             users=(User(login="alice"), User(login="bob")),
             tokens=(
                 AccessToken(value="ghs_dup", owner="alice"),
                 AccessToken(value="ghs_dup", owner="bob"),
             ),
-        )
-
-        with pytest.raises(ConfigValidationError, match="Duplicate token value"):
-            scenario.validate()
-
-    @staticmethod
-    def test_token_permissions_must_be_unique_per_token() -> None:
-        """Duplicate permissions on a single token must be rejected."""
-        scenario = ScenarioConfig(
+        ),
+        _ERR_DUP_VALUE,
+        id="duplicate-value",
+    ),
+    pytest.param(
+        ScenarioConfig(
             users=(User(login="alice"),),
             tokens=(
                 AccessToken(
@@ -143,15 +117,12 @@ class TestAuthTokens:
                     permissions=("repo", "repo"),
                 ),
             ),
-        )
-
-        with pytest.raises(ConfigValidationError, match="Duplicate token permission"):
-            scenario.validate()
-
-    @staticmethod
-    def test_token_repositories_must_be_unique_per_token() -> None:
-        """Duplicate repository references on a single token must be rejected."""
-        scenario = ScenarioConfig(
+        ),
+        _ERR_DUP_PERMISSION,
+        id="duplicate-permission",
+    ),
+    pytest.param(
+        ScenarioConfig(
             users=(User(login="alice"),),
             repositories=(Repository(owner="alice", name="repo1"),),
             tokens=(
@@ -161,18 +132,12 @@ class TestAuthTokens:
                     repositories=("alice/repo1", "alice/repo1"),
                 ),
             ),
-        )
-
-        with pytest.raises(
-            ConfigValidationError,
-            match="Duplicate token repository reference",
-        ):
-            scenario.validate()
-
-    @staticmethod
-    def test_token_repository_reference_requires_owner_and_name() -> None:
-        """Repository references must include owner and name."""
-        scenario = ScenarioConfig(
+        ),
+        _ERR_DUP_REPO,
+        id="duplicate-repo",
+    ),
+    pytest.param(
+        ScenarioConfig(
             users=(User(login="alice"),),
             repositories=(Repository(owner="alice", name="repo1"),),
             tokens=(
@@ -182,22 +147,90 @@ class TestAuthTokens:
                     repositories=("alice/repo1", "owneronly"),
                 ),
             ),
-        )
+        ),
+        _ERR_MALFORMED_REPO,
+        id="malformed-repo",
+    ),
+]
 
-        with pytest.raises(
-            ConfigValidationError,
-            match="Token repository must be in the form",
-        ):
+
+class TestAuthTokens:
+    """Group basic token validation and selection tests."""
+
+    @staticmethod
+    @pytest.mark.parametrize(("scenario", "match"), _VALIDATION_REJECT_CASES)
+    def test_validation_rejects(
+        scenario: ScenarioConfig,
+        match: re.Pattern[str],
+    ) -> None:
+        """Invalid token configurations must be rejected by validate()."""
+        with pytest.raises(ConfigValidationError, match=match):
             scenario.validate()
 
+    @staticmethod
+    @pytest.mark.parametrize(
+        ("tokens", "default", "expected"),
+        [
+            pytest.param(
+                (_GHS_ONE, _GHS_TWO),
+                "ghs_two",
+                "ghs_two",
+                id="prefers-default",
+            ),
+            pytest.param(
+                (
+                    AccessToken(value="ghs_first", owner="alice"),
+                    AccessToken(value="ghs_second", owner="alice"),
+                ),
+                "ghs_first",
+                "ghs_first",
+                id="single-active-per-session",
+            ),
+        ],
+    )
+    def test_resolve_auth_token_prefers_default(
+        base_alice_scenario: ScenarioConfig,
+        tokens: tuple[AccessToken, ...],
+        default: str,
+        expected: str,
+    ) -> None:
+        """Default tokens select the Authorization header value.
+
+        This also documents the single-active-token limitation from
+        ``docs/users-guide.md``: ``default_token`` selects exactly one value
+        that is set on the ``github3.py`` session for the fixture lifetime.
+        """
+        scenario = dc.replace(
+            base_alice_scenario,
+            tokens=tokens,
+            default_token=default,
+        )
+
+        resolved = scenario.resolve_auth_token()
+
+        assert resolved == expected, "expected default token to be selected"
+        assert isinstance(resolved, str), (
+            "Expected resolve_auth_token to return a single string, not a collection"
+        )
+
+    @staticmethod
+    def test_resolve_auth_token_requires_selection_for_multiple_tokens(
+        base_alice_scenario: ScenarioConfig,
+    ) -> None:
+        """Multiple tokens require an explicit default selection."""
+        scenario = dc.replace(base_alice_scenario, tokens=(_GHS_ONE, _GHS_TWO))
+
+        with pytest.raises(ConfigValidationError, match=_ERR_MULTIPLE_TOKENS):
+            scenario.resolve_auth_token()
+
     @staticmethod
     def test_access_token_normalizes_collections() -> None:
         """AccessToken should normalize permissions and repositories to tuples."""
         token = AccessToken(
             value="ghs_norm",
             owner="alice",
-            permissions=typ.cast("tuple[str, ...]", ["repo"]),
-            repositories=typ.cast("tuple[str, ...]", ["alice/repo1"]),
+            permissions=iter(["repo"]),  # type: ignore[arg-type]
+            repositories=iter(["alice/repo1"]),  # type: ignore[arg-type]
         )
 
         assert token.permissions == ("repo",), (
@@ -217,7 +250,7 @@ class TestAuthTokens:
             AccessToken(
                 value="ghs_perm",
                 owner="alice",
-                permissions=typ.cast("tuple[str, ...]", "repo"),
+                permissions="repo",  # type: ignore[arg-type]
             )
 
         with pytest.raises(
@@ -227,69 +260,52 @@ class TestAuthTokens:
             AccessToken(
                 value="ghs_repo",
                 owner="alice",
-                repositories=typ.cast("tuple[str, ...]", "alice/repo"),
+                repositories="alice/repo",  # type: ignore[arg-type]
             )
 
     @staticmethod
-    def test_resolve_auth_token_returns_none_without_tokens() -> None:
+    def test_resolve_auth_token_returns_none_without_tokens(
+        base_alice_scenario: ScenarioConfig,
+    ) -> None:
         """No tokens configured should return None."""
-        scenario = ScenarioConfig(users=(User(login="alice"),))
-
-        assert scenario.resolve_auth_token() is None, (
+        assert base_alice_scenario.resolve_auth_token() is None, (
             "Expected no token to resolve when none are configured"
         )
 
     @staticmethod
-    def test_resolve_auth_token_uses_single_token() -> None:
+    def test_resolve_auth_token_uses_single_token(
+        validated_happy_scenario: ScenarioConfig,
+    ) -> None:
         """Single token without a default should be selected."""
-        scenario = ScenarioConfig(
-            users=(User(login="alice"),),
-            tokens=(AccessToken(value="ghs_one", owner="alice"),),
-        )
-
-        assert scenario.resolve_auth_token() == "ghs_one", (
+        assert validated_happy_scenario.resolve_auth_token() == "ghs_123", (
             "Expected single token to be selected"
         )
 
     @staticmethod
-    def test_default_token_must_match_configured_tokens() -> None:
-        """Default tokens must reference a configured value."""
-        scenario = ScenarioConfig(
-            users=(User(login="alice"),),
-            tokens=(AccessToken(value="ghs_one", owner="alice"),),
+    @pytest.mark.parametrize("method", ["validate", "resolve_auth_token"])
+    def test_default_token_must_match_configured_tokens(
+        base_alice_scenario: ScenarioConfig,
+        method: str,
+    ) -> None:
+        """Default token mismatches surface from both validation entry points."""
+        scenario = dc.replace(
+            base_alice_scenario,
+            tokens=(_GHS_ONE,),
             default_token="ghs_missing",  # noqa: S106 # TODO(simulacat#123): add secure token value
         )
 
-        with pytest.raises(
-            ConfigValidationError,
-            match="Default token must match one of the configured tokens",
-        ):
-            scenario.validate()
-
-        with pytest.raises(
-            ConfigValidationError,
-            match="Default token must match one of the configured tokens",
-        ):
-            scenario.resolve_auth_token()
+        with pytest.raises(ConfigValidationError, match=_ERR_DEFAULT_MISMATCH):
+            getattr(scenario, method)()
 
     @staticmethod
-    def test_token_validation_happy_path() -> None:
-        """A valid token configuration should pass validation and resolve."""
-        scenario = ScenarioConfig(
-            users=(User(login="alice"),),
-            repositories=(Repository(owner="alice", name="demo-repo"),),
-            tokens=(
-                AccessToken(
-                    value="ghs_123",
-                    owner="alice",
-                    permissions=("repo",),
-                    repositories=("alice/demo-repo",),
-                    repository_visibility="private",
-                ),
-            ),
-        )
-
-        scenario.validate()
-        assert scenario.resolve_auth_token() == "ghs_123", (
+    def test_token_validation_happy_path(
+        validated_happy_scenario: ScenarioConfig,
+    ) -> None:
+        """A valid token configuration should pass validation and resolve.
+
+        The shared fixture runs ``validate()`` once at session scope; this
+        test asserts on the resolved token of the already-validated scenario.
+        """
+        assert validated_happy_scenario.resolve_auth_token() == "ghs_123", (
             "Expected configured token to resolve"
         )
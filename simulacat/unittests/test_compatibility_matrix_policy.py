@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import re
 
 from packaging.version import Version
@@ -11,6 +12,24 @@ from simulacat.compatibility_policy import (
     KNOWN_INCOMPATIBILITIES,
 )
 
+# Hoisted once at module load; dict keys() views compare directly against
+# sets, so the coverage test allocates nothing per run.
+_EXPECTED_DEPENDENCIES = frozenset({
+    "python",
+    "github3.py",
+    "node.js",
+    "@simulacrum/github-api-simulator",
+})
+
+# Compiled once at module load; shared by any policy format assertions.
+_MAJOR_X_PATTERN = re.compile(r"^\d+\.x$")
+
+
+@functools.cache
+def _parse_version(raw: str) -> Version:
+    """Parse ``raw`` once; policy version strings are immutable constants."""
+    return Version(raw)
+
 
 class TestCompatibilityMatrixPolicy:
     """Validate the compatibility policy surface and documentation contracts."""
@@ -18,12 +37,7 @@ class TestCompatibilityMatrixPolicy:
     @staticmethod
     def test_policy_covers_required_dependencies() -> None:
         """Compatibility policy includes all Step 4.1 dependency dimensions."""
-        assert set(COMPATIBILITY_POLICY) == {
-            "python",
-            "github3.py",
-            "node.js",
-            "@simulacrum/github-api-simulator",
-        }, (
+        assert COMPATIBILITY_POLICY.keys() == _EXPECTED_DEPENDENCIES, (
             "Expected compatibility policy keys for Python, github3.py, "
             "Node.js, and @simulacrum/github-api-simulator."
         )
@@ -38,7 +52,7 @@ class TestCompatibilityMatrixPolicy:
         )
         for dependency_name in semver_dependencies:
             policy = COMPATIBILITY_POLICY[dependency_name]
-            assert Version(policy.minimum_version) <= Version(
+            assert _parse_version(policy.minimum_version) <= _parse_version(
                 policy.recommended_version
             ), f"Expected minimum <= recommended for {dependency_name}"
 
@@ -46,11 +60,10 @@ class TestCompatibilityMatrixPolicy:
     def test_nodejs_policy_uses_major_x_format() -> None:
         """Node.js policy declares major tracks in ``<major>.x`` form."""
         policy = COMPATIBILITY_POLICY["node.js"]
-        major_x_pattern = re.compile(r"^\d+\.x$")
-        assert major_x_pattern.match(policy.minimum_version), (
+        assert _MAJOR_X_PATTERN.match(policy.minimum_version), (
             "Expected Node.js minimum version to use <major>.x format"
         )
-        assert major_x_pattern.match(policy.recommended_version), (
+        assert _MAJOR_X_PATTERN.match(policy.recommended_version), (
             "Expected Node.js recommended version to use <major>.x format"
         )
 
@@ -58,10 +71,15 @@ class TestCompatibilityMatrixPolicy:
     def test_known_incompatibilities_have_signature_and_workaround() -> None:
         """Known incompatibilities include reproducible signatures and workarounds."""
         assert KNOWN_INCOMPATIBILITIES, "Expected at least one known incompatibility"
-        for incompatibility in KNOWN_INCOMPATIBILITIES:
-            assert incompatibility.failure_signature.strip(), (
-                "Expected known incompatibility to include failure signature"
-            )
-            assert incompatibility.workaround.strip(), (
-                "Expected known incompatibility to include workaround"
-            )
+        # isspace() checks avoid allocating stripped copies per record.
+        incomplete = [
+            incompatibility
+            for incompatibility in KNOWN_INCOMPATIBILITIES
+            if not incompatibility.failure_signature
+            or incompatibility.failure_signature.isspace()
+            or not incompatibility.workaround
+            or incompatibility.workaround.isspace()
+        ]
+        assert not incomplete, (
+            f"Incompatibilities missing signature/workaround: {incomplete}"
+        )
@@ -31,6 +31,14 @@ from pathlib import Path
 
 import pytest
 
+from simulacat import config as config_module
+from simulacat import fixtures as fixtures_module
+from simulacat.config import (
+    default_github_sim_config,
+    is_json_serializable,
+    merge_configs,
+)
+
 if typ.TYPE_CHECKING:
     from simulacat.types import GitHubSimConfig
 
@@ -41,8 +49,6 @@ class TestDefaultGithubSimConfig:
     @staticmethod
     def test_returns_empty_mapping() -> None:
         """The default configuration is an empty mapping."""
-        from simulacat.config import default_github_sim_config
-
         config = default_github_sim_config()
 
         assert config == {}, f"Expected empty mapping, got {config}"
@@ -50,8 +56,6 @@ class TestDefaultGithubSimConfig:
     @staticmethod
     def test_returns_dict_type() -> None:
         """The default configuration returns a dict instance."""
-        from simulacat.config import default_github_sim_config
-
         config = default_github_sim_config()
 
         assert isinstance(config, dict), f"Expected dict, got {type(config)}"
@@ -59,8 +63,6 @@ class TestDefaultGithubSimConfig:
     @staticmethod
     def test_is_json_serializable() -> None:
         """The default configuration can be serialized to JSON."""
-        from simulacat.config import default_github_sim_config
-
         config = default_github_sim_config()
 
         try:
@@ -76,21 +78,19 @@ class TestIsJsonSerializable:
     @staticmethod
     def test_accepts_empty_dict() -> None:
         """Empty dictionaries are serializable."""
-        from simulacat.config import is_json_serializable
-
         assert is_json_serializable({}) is True
 
     @staticmethod
     def test_accepts_nested_dicts() -> None:
         """Nested dictionaries with JSON types are serializable."""
-        from simulacat.config import is_json_serializable
-
         config = {
             "users": [{"login": "test", "organizations": []}],
             "count": 42,
             "enabled": True,
             "ratio": 1.5,
             "nothing": None,
+            # Tuples serialize as JSON arrays, matching json.dumps defaults.
+            "pair": ("a", "b"),
         }
 
         assert is_json_serializable(config) is True
@@ -98,8 +98,6 @@ class TestIsJsonSerializable:
     @staticmethod
     def test_rejects_path_objects() -> None:
         """Path objects are not JSON serializable."""
-        from simulacat.config import is_json_serializable
-
         config = {"path": Path("/example/test")}
 
         assert is_json_serializable(config) is False
@@ -107,8 +105,6 @@ class TestIsJsonSerializable:
     @staticmethod
     def test_rejects_functions() -> None:
         """Function objects are not JSON serializable."""
-        from simulacat.config import is_json_serializable
-
         config = {"callback": lambda x: x}
 
         assert is_json_serializable(config) is False
@@ -116,8 +112,6 @@ class TestIsJsonSerializable:
     @staticmethod
     def test_rejects_custom_objects() -> None:
         """Custom class instances are not JSON serializable."""
-        from simulacat.config import is_json_serializable
-
         class Custom:
             pass
 
@@ -125,6 +119,25 @@ class TestIsJsonSerializable:
 
         assert is_json_serializable(config) is False
 
+    @staticmethod
+    def test_rejects_self_referential_containers() -> None:
+        """Circular references return False instead of recursing forever."""
+        config: dict[str, object] = {}
+        config["self"] = config
+        cyclic_list: list[object] = []
+        cyclic_list.append(cyclic_list)
+
+        assert is_json_serializable(config) is False
+        assert is_json_serializable(cyclic_list) is False
+
+    @staticmethod
+    def test_accepts_shared_subtrees() -> None:
+        """The same acyclic container referenced twice is still serializable."""
+        shared = {"login": "test"}
+        config = {"first": shared, "second": shared}
+
+        assert is_json_serializable(config) is True
+
 
 class TestGithubSimConfigType:
     """Tests for the GitHubSimConfig type alias."""
@@ -154,8 +167,6 @@ class TestMergeConfigs:
     @staticmethod
     def test_no_args_returns_empty() -> None:
         """Calling merge_configs() with no arguments returns empty dict."""
-        from simulacat.config import merge_configs
-
         result = merge_configs()
 
         assert result == {}
@@ -163,8 +174,6 @@ class TestMergeConfigs:
     @staticmethod
     def test_empty_configs_return_empty() -> None:
         """Merging empty configs returns empty dict."""
-        from simulacat.config import merge_configs
-
         result = merge_configs({}, {})
 
         assert result == {}
@@ -172,8 +181,6 @@ class TestMergeConfigs:
     @staticmethod
     def test_later_config_wins() -> None:
         """Later configurations override earlier ones."""
-        from simulacat.config import merge_configs
-
         base = {"users": [{"login": "base"}]}
         override = {"users": [{"login": "override"}]}
 
@@ -184,8 +191,6 @@ class TestMergeConfigs:
     @staticmethod
     def test_preserves_unoverridden_keys() -> None:
         """Keys not in override are preserved from base."""
-        from simulacat.config import merge_configs
-
         base = {"users": [{"login": "base"}], "organizations": []}
         override = {"users": [{"login": "override"}]}
 
@@ -197,8 +202,6 @@ class TestMergeConfigs:
     @staticmethod
     def test_multiple_configs_merge_in_order() -> None:
         """Multiple configs merge left to right."""
-        from simulacat.config import merge_configs
-
         first = {"a": 1}
         second = {"b": 2}
         third = {"a": 3, "c": 4}
@@ -214,42 +217,43 @@ class TestFixtureRegistration:
     @staticmethod
     def test_config_module_exists() -> None:
         """The config module exists and can be imported."""
-        from simulacat import config
-
-        assert hasattr(config, "default_github_sim_config")
-        assert hasattr(config, "is_json_serializable")
-        assert hasattr(config, "merge_configs")
+        expected = {
+            "default_github_sim_config",
+            "is_json_serializable",
+            "merge_configs",
+        }
+        missing = expected - set(dir(config_module))
+        assert not missing, f"Missing config attributes: {missing}"
 
     @staticmethod
     def test_fixtures_module_exists() -> None:
         """The fixtures module exists and can be imported."""
-        from simulacat import fixtures
-
-        assert hasattr(fixtures, "github_sim_config")
-        assert hasattr(fixtures, "simulacat_single_repo")
-        assert hasattr(fixtures, "simulacat_empty_org")
+        # dir() rather than vars(): the fixtures module publishes its names
+        # lazily through module __getattr__/__dir__, so they are absent from
+        # the module dict until first access.
+        expected = {
+            "github_sim_config",
+            "simulacat_single_repo",
+            "simulacat_empty_org",
+        }
+        missing = expected - set(dir(fixtures_module))
+        assert not missing, f"Missing fixture attributes: {missing}"
 
     @staticmethod
     def test_github_sim_config_is_callable() -> None:
         """The github_sim_config fixture function is callable."""
-        from simulacat.fixtures import github_sim_config
-
-        # The fixture function should be callable
-        assert callable(github_sim_config)
+        # Attribute access keeps pytest from re-registering the fixture here.
+        assert callable(fixtures_module.github_sim_config)
 
     @staticmethod
     def test_simulacat_single_repo_fixture_is_callable() -> None:
         """The simulacat_single_repo fixture function is callable."""
-        from simulacat.fixtures import simulacat_single_repo
-
-        assert callable(simulacat_single_repo)
+        assert callable(fixtures_module.simulacat_single_repo)
 
     @staticmethod
     def test_simulacat_empty_org_fixture_is_callable() -> None:
         """The simulacat_empty_org fixture function is callable."""
-        from simulacat.fixtures import simulacat_empty_org
-
-        assert callable(simulacat_empty_org)
+        assert callable(fixtures_module.simulacat_empty_org)
 
 
 def test_simulacat_single_repo_fixture_returns_expected_config(
@@ -274,12 +278,12 @@ def test_simulacat_single_repo_fixture_returns_expected_config(
     assert orgs == []
 
     branches = typ.cast("list[dict[str, typ.Any]]", config.get("branches", []))
-    assert any(
-        branch.get("owner") == "octocat"
-        and branch.get("repository") == "demo-repo"
-        and branch.get("name") == "main"
+    # One pass over branches; reuse this index for further existence checks.
+    branch_keys = {
+        (branch.get("owner"), branch.get("repository"), branch.get("name"))
         for branch in branches
-    )
+    }
+    assert ("octocat", "demo-repo", "main") in branch_keys
 
 
 def test_simulacat_empty_org_fixture_returns_expected_config(
@@ -17,11 +17,13 @@ Or run via make::
 
 from __future__ import annotations
 
-import typing as typ
+import dataclasses as dc
+import re
 
 import pytest
 
 from simulacat import (
+    AccessToken,
     AppInstallation,
     ConfigValidationError,
     GitHubApp,
@@ -30,79 +32,159 @@ from simulacat import (
     User,
 )
 
+# Frozen model atoms shared by the parametrize tables and tests below;
+# built once per module load instead of per test. Variants derive from
+# these with dc.replace rather than reconstructing from scratch.
+_ALICE = User(login="alice")
+_MY_BOT = GitHubApp(app_slug="my-bot", name="Bot")
+
+# Error-message contracts under test, compiled once per module load.
+# ``pytest.raises(match=...)`` accepts compiled patterns, so each test run
+# skips the per-invocation re.compile.
+_ERR_DUP_APP_SLUG = re.compile(r"Duplicate app slug")
+_ERR_APP_OWNER = re.compile(r"App owner must be a defined user or organization")
+_ERR_APP_ID = re.compile(r"App ID must be a positive integer")
+_ERR_INSTALL_APP = re.compile(r"Installation app must reference a defined GitHub App")
+_ERR_INSTALL_ACCOUNT = re.compile(
+    r"Installation account must be a defined user or organization"
+)
+_ERR_INSTALL_REPO = re.compile(
+    r"Installation repository must reference a configured repository"
+)
+_ERR_INSTALL_ID = re.compile(r"Installation ID must be a positive integer")
+_ERR_DUP_INSTALL_ID = re.compile(r"Duplicate installation ID")
+_ERR_DUP_INSTALL_PERMISSION = re.compile(r"Duplicate installation permission")
+_ERR_MULTIPLE_TOKENS = re.compile(r"Multiple tokens configured")
+_ERR_DUP_TOKEN_VALUE = re.compile(r"Duplicate token value")
+
+
+# Built once per module load; ScenarioConfig stores immutable tuples and
+# validate() is pure, so the happy-path and serialization tests can safely
+# share this instance.
+_HAPPY_APP_SCENARIO = ScenarioConfig(
+    users=(User(login="octocat"),),
+    repositories=(Repository(owner="octocat", name="hello-world"),),
+    apps=(
+        GitHubApp(
+            app_slug="my-bot",
+            name="My Bot",
+            app_id=12345,
+            owner="octocat",
+        ),
+    ),
+    app_installations=(
+        AppInstallation(
+            installation_id=1,
+            app_slug="my-bot",
+            account="octocat",
+            repositories=("octocat/hello-world",),
+            permissions=("contents", "pull_requests"),
+            access_token="ghs_installation_token",  # noqa: S106 — FIXME: use env or fixture for test tokens
+        ),
+    ),
+)
 
-class TestGitHubAppModel:
-    """Group tests for GitHubApp dataclass construction."""
 
-    @staticmethod
-    def test_github_app_basic_construction() -> None:
-        """GitHubApp can be constructed with required fields."""
-        app = GitHubApp(app_slug="my-bot", name="My Bot")
+# One row per construction shape: the kwargs passed to the constructor and
+# the full expected field values, including defaults.
+_GITHUB_APP_CONSTRUCTION_CASES = [
+    pytest.param(
+        {"app_slug": "my-bot", "name": "My Bot"},
+        {"app_slug": "my-bot", "name": "My Bot", "app_id": None, "owner": None},
+        id="required-fields-only",
+    ),
+    pytest.param(
+        {
+            "app_slug": "deploy-bot",
+            "name": "Deploy Bot",
+            "app_id": 12345,
+            "owner": "octocat",
+        },
+        {
+            "app_slug": "deploy-bot",
+            "name": "Deploy Bot",
+            "app_id": 12345,
+            "owner": "octocat",
+        },
+        id="all-fields",
+    ),
+]
+
+_APP_INSTALLATION_CONSTRUCTION_CASES = [
+    pytest.param(
+        {"installation_id": 1, "app_slug": "my-bot", "account": "octocat"},
+        {
+            "installation_id": 1,
+            "app_slug": "my-bot",
+            "account": "octocat",
+            "repositories": (),
+            "permissions": (),
+            "access_token": None,
+        },
+        id="required-fields-only",
+    ),
+    pytest.param(
+        {
+            "installation_id": 42,
+            "app_slug": "deploy-bot",
+            "account": "octocat",
+            "repositories": ("octocat/hello-world",),
+            "permissions": ("contents", "pull_requests"),
+            "access_token": "ghs_install_token",
+        },
+        {
+            "installation_id": 42,
+            "app_slug": "deploy-bot",
+            "account": "octocat",
+            "repositories": ("octocat/hello-world",),
+            "permissions": ("contents", "pull_requests"),
+            "access_token": "ghs_install_token",
+        },
+        id="all-fields",
+    ),
+]
 
-        assert app.app_slug == "my-bot", "Expected app_slug to match"
-        assert app.name == "My Bot", "Expected name to match"
-        assert app.app_id is None, "Expected app_id to default to None"
-        assert app.owner is None, "Expected owner to default to None"
 
-    @staticmethod
-    def test_github_app_with_all_fields() -> None:
-        """GitHubApp accepts optional app_id and owner."""
-        app = GitHubApp(
-            app_slug="deploy-bot",
-            name="Deploy Bot",
-            app_id=12345,
-            owner="octocat",
-        )
+class TestGitHubAppModel:
+    """Group tests for GitHubApp dataclass construction."""
 
-        assert app.app_slug == "deploy-bot", "Expected app_slug to match"
-        assert app.name == "Deploy Bot", "Expected name to match"
-        assert app.app_id == 12345, "Expected app_id to match"
-        assert app.owner == "octocat", "Expected owner to match"
+    @staticmethod
+    @pytest.mark.parametrize(("kwargs", "expected"), _GITHUB_APP_CONSTRUCTION_CASES)
+    def test_construction_round_trip(
+        kwargs: dict[str, object],
+        expected: dict[str, object],
+    ) -> None:
+        """GitHubApp construction exposes the expected field values."""
+        app = GitHubApp(**kwargs)  # type: ignore[arg-type]
+
+        mismatched = {
+            field: getattr(app, field)
+            for field, value in expected.items()
+            if getattr(app, field) != value
+        }
+        assert not mismatched, f"Unexpected field values: {mismatched}"
 
 
 class TestAppInstallationModel:
     """Group tests for AppInstallation dataclass construction."""
 
     @staticmethod
-    def test_app_installation_basic_construction() -> None:
-        """AppInstallation can be constructed with required fields."""
-        installation = AppInstallation(
-            installation_id=1,
-            app_slug="my-bot",
-            account="octocat",
-        )
-
-        assert installation.installation_id == 1, "Expected installation_id to match"
-        assert installation.app_slug == "my-bot", "Expected app_slug to match"
-        assert installation.account == "octocat", "Expected account to match"
-        assert installation.repositories == (), "Expected empty repositories tuple"
-        assert installation.permissions == (), "Expected empty permissions tuple"
-        assert installation.access_token is None, (
-            "Expected access_token to default to None"
-        )
-
-    @staticmethod
-    def test_app_installation_with_all_fields() -> None:
-        """AppInstallation accepts optional repositories, permissions, and token."""
-        installation = AppInstallation(
-            installation_id=42,
-            app_slug="deploy-bot",
-            account="octocat",
-            repositories=("octocat/hello-world",),
-            permissions=("contents", "pull_requests"),
-            access_token="ghs_install_token",  # noqa: S106 — FIXME: use env or fixture for test tokens
-        )
-
-        assert installation.installation_id == 42, "Expected installation_id to match"
-        assert installation.repositories == ("octocat/hello-world",), (
-            "Expected repositories to match"
-        )
-        assert installation.permissions == ("contents", "pull_requests"), (
-            "Expected permissions to match"
-        )
-        assert installation.access_token == "ghs_install_token", (  # noqa: S105 — FIXME: use env or fixture for test tokens
-            "Expected access_token to match"
-        )
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"), _APP_INSTALLATION_CONSTRUCTION_CASES
+    )
+    def test_construction_round_trip(
+        kwargs: dict[str, object],
+        expected: dict[str, object],
+    ) -> None:
+        """AppInstallation construction exposes the expected field values."""
+        installation = AppInstallation(**kwargs)  # type: ignore[arg-type]
+
+        mismatched = {
+            field: getattr(installation, field)
+            for field, value in expected.items()
+            if getattr(installation, field) != value
+        }
+        assert not mismatched, f"Unexpected field values: {mismatched}"
 
     @staticmethod
     def test_app_installation_normalizes_collections() -> None:
@@ -111,8 +193,8 @@ class TestAppInstallationModel:
             installation_id=1,
             app_slug="my-bot",
             account="octocat",
-            repositories=typ.cast("tuple[str, ...]", ["octocat/repo"]),
-            permissions=typ.cast("tuple[str, ...]", ["contents"]),
+            repositories=["octocat/repo"],  # type: ignore[arg-type]
+            permissions=["contents"],  # type: ignore[arg-type]
         )
 
         assert installation.repositories == ("octocat/repo",), (
@@ -133,7 +215,7 @@ class TestAppInstallationModel:
                 installation_id=1,
                 app_slug="my-bot",
                 account="octocat",
-                repositories=typ.cast("tuple[str, ...]", "octocat/repo"),
+                repositories="octocat/repo",  # type: ignore[arg-type]
             )
 
     @staticmethod
@@ -147,63 +229,46 @@ class TestAppInstallationModel:
                 installation_id=1,
                 app_slug="my-bot",
                 account="octocat",
-                permissions=typ.cast("tuple[str, ...]", "contents"),
+                permissions="contents",  # type: ignore[arg-type]
             )
 
 
-class TestGitHubAppValidation:
-    """Group tests for ScenarioConfig validation of GitHub App entries."""
-
-    @staticmethod
-    def test_app_slug_must_be_unique() -> None:
-        """Duplicate app slugs must be rejected."""
-        scenario = ScenarioConfig(
-            users=(User(login="alice"),),
+# One row per invalid app configuration; mirrors the table style used by
+# the token validation tests.
+_INVALID_APP_CASES = [
+    pytest.param(
+        ScenarioConfig(
+            users=(_ALICE,),
             apps=(
                 GitHubApp(app_slug="my-bot", name="Bot One"),
                 GitHubApp(app_slug="my-bot", name="Bot Two"),
             ),
-        )
-
-        with pytest.raises(ConfigValidationError, match="Duplicate app slug"):
-            scenario.validate()
-
-    @staticmethod
-    def test_app_owner_must_exist_when_set() -> None:
-        """App owner must reference a defined user or organization."""
-        scenario = ScenarioConfig(
-            users=(User(login="alice"),),
-            apps=(GitHubApp(app_slug="my-bot", name="Bot", owner="missing"),),
-        )
-
-        with pytest.raises(
-            ConfigValidationError,
-            match="App owner must be a defined user or organization",
-        ):
-            scenario.validate()
-
-    @staticmethod
-    def test_app_id_must_be_positive_when_set() -> None:
-        """App ID must be a positive integer when provided."""
-        scenario = ScenarioConfig(
-            users=(User(login="alice"),),
-            apps=(GitHubApp(app_slug="my-bot", name="Bot", app_id=-1),),
-        )
-
-        with pytest.raises(
-            ConfigValidationError, match="App ID must be a positive integer"
-        ):
-            scenario.validate()
-
-
-class TestAppInstallationValidation:
-    """Group tests for ScenarioConfig validation of installation entries."""
-
-    @staticmethod
-    def test_installation_app_slug_must_reference_defined_app() -> None:
-        """Installation app_slug must reference a defined GitHubApp."""
-        scenario = ScenarioConfig(
-            users=(User(login="alice"),),
+        ),
+        _ERR_DUP_APP_SLUG,
+        id="duplicate-slug",
+    ),
+    pytest.param(
+        ScenarioConfig(
+            users=(_ALICE,),
+            apps=(dc.replace(_MY_BOT, owner="missing"),),
+        ),
+        _ERR_APP_OWNER,
+        id="owner-missing",
+    ),
+    pytest.param(
+        ScenarioConfig(
+            users=(_ALICE,),
+            apps=(dc.replace(_MY_BOT, app_id=-1),),
+        ),
+        _ERR_APP_ID,
+        id="negative-app-id",
+    ),
+]
+
+_INVALID_INSTALLATION_CASES = [
+    pytest.param(
+        ScenarioConfig(
+            users=(_ALICE,),
             apps=(GitHubApp(app_slug="real-bot", name="Real Bot"),),
             app_installations=(
                 AppInstallation(
@@ -212,20 +277,14 @@ class TestAppInstallationValidation:
                     account="alice",
                 ),
             ),
-        )
-
-        with pytest.raises(
-            ConfigValidationError,
-            match="Installation app must reference a defined GitHub App",
-        ):
-            scenario.validate()
-
-    @staticmethod
-    def test_installation_account_must_exist() -> None:
-        """Installation account must reference a defined user or organization."""
-        scenario = ScenarioConfig(
-            users=(User(login="alice"),),
-            apps=(GitHubApp(app_slug="my-bot", name="Bot"),),
+        ),
+        _ERR_INSTALL_APP,
+        id="app-missing",
+    ),
+    pytest.param(
+        ScenarioConfig(
+            users=(_ALICE,),
+            apps=(_MY_BOT,),
             app_installations=(
                 AppInstallation(
                     installation_id=1,
@@ -233,21 +292,15 @@ class TestAppInstallationValidation:
                     account="missing",
                 ),
             ),
-        )
-
-        with pytest.raises(
-            ConfigValidationError,
-            match="Installation account must be a defined user or organization",
-        ):
-            scenario.validate()
-
-    @staticmethod
-    def test_installation_repositories_must_reference_defined_repos() -> None:
-        """Installation repository references must match defined repositories."""
-        scenario = ScenarioConfig(
-            users=(User(login="alice"),),
+        ),
+        _ERR_INSTALL_ACCOUNT,
+        id="account-missing",
+    ),
+    pytest.param(
+        ScenarioConfig(
+            users=(_ALICE,),
             repositories=(Repository(owner="alice", name="demo"),),
-            apps=(GitHubApp(app_slug="my-bot", name="Bot"),),
+            apps=(_MY_BOT,),
             app_installations=(
                 AppInstallation(
                     installation_id=1,
@@ -256,20 +309,14 @@ class TestAppInstallationValidation:
                     repositories=("alice/unknown",),
                 ),
             ),
-        )
-
-        with pytest.raises(
-            ConfigValidationError,
-            match="Installation repository must reference a configured repository",
-        ):
-            scenario.validate()
-
-    @staticmethod
-    def test_installation_id_must_be_positive() -> None:
-        """Installation ID must be a positive integer."""
-        scenario = ScenarioConfig(
-            users=(User(login="alice"),),
-            apps=(GitHubApp(app_slug="my-bot", name="Bot"),),
+        ),
+        _ERR_INSTALL_REPO,
+        id="repo-missing",
+    ),
+    pytest.param(
+        ScenarioConfig(
+            users=(_ALICE,),
+            apps=(_MY_BOT,),
             app_installations=(
                 AppInstallation(
                     installation_id=0,
@@ -277,20 +324,14 @@ class TestAppInstallationValidation:
                     account="alice",
                 ),
             ),
-        )
-
-        with pytest.raises(
-            ConfigValidationError,
-            match="Installation ID must be a positive integer",
-        ):
-            scenario.validate()
-
-    @staticmethod
-    def test_installation_id_must_be_unique() -> None:
-        """Duplicate installation IDs must be rejected."""
-        scenario = ScenarioConfig(
-            users=(User(login="alice"),),
-            apps=(GitHubApp(app_slug="my-bot", name="Bot"),),
+        ),
+        _ERR_INSTALL_ID,
+        id="non-positive-id",
+    ),
+    pytest.param(
+        ScenarioConfig(
+            users=(_ALICE,),
+            apps=(_MY_BOT,),
             app_installations=(
                 AppInstallation(
                     installation_id=1,
@@ -303,20 +344,14 @@ class TestAppInstallationValidation:
                     account="alice",
                 ),
             ),
-        )
-
-        with pytest.raises(
-            ConfigValidationError,
-            match="Duplicate installation ID",
-        ):
-            scenario.validate()
-
-    @staticmethod
-    def test_installation_permissions_must_be_unique() -> None:
-        """Duplicate permissions on a single installation must be rejected."""
-        scenario = ScenarioConfig(
-            users=(User(login="alice"),),
-            apps=(GitHubApp(app_slug="my-bot", name="Bot"),),
+        ),
+        _ERR_DUP_INSTALL_ID,
+        id="duplicate-id",
+    ),
+    pytest.param(
+        ScenarioConfig(
+            users=(_ALICE,),
+            apps=(_MY_BOT,),
             app_installations=(
                 AppInstallation(
                     installation_id=1,
@@ -325,12 +360,38 @@ class TestAppInstallationValidation:
                     permissions=("contents", "contents"),
                 ),
             ),
-        )
+        ),
+        _ERR_DUP_INSTALL_PERMISSION,
+        id="duplicate-permission",
+    ),
+]
 
-        with pytest.raises(
-            ConfigValidationError,
-            match="Duplicate installation permission",
-        ):
+
+class TestGitHubAppValidation:
+    """Group tests for ScenarioConfig validation of GitHub App entries."""
+
+    @staticmethod
+    @pytest.mark.parametrize(("scenario", "match"), _INVALID_APP_CASES)
+    def test_validation_rejects(
+        scenario: ScenarioConfig,
+        match: re.Pattern[str],
+    ) -> None:
+        """Invalid GitHub App configurations must be rejected by validate()."""
+        with pytest.raises(ConfigValidationError, match=match):
+            scenario.validate()
+
+
+class TestAppInstallationValidation:
+    """Group tests for ScenarioConfig validation of installation entries."""
+
+    @staticmethod
+    @pytest.mark.parametrize(("scenario", "match"), _INVALID_INSTALLATION_CASES)
+    def test_validation_rejects(
+        scenario: ScenarioConfig,
+        match: re.Pattern[str],
+    ) -> None:
+        """Invalid installation configurations must be rejected by validate()."""
+        with pytest.raises(ConfigValidationError, match=match):
             scenario.validate()
 
 
@@ -341,8 +402,8 @@ class TestInstallationTokenIntegration:
     def test_installation_token_resolves_as_single_token() -> None:
         """A single installation token auto-selects for auth."""
         scenario = ScenarioConfig(
-            users=(User(login="alice"),),
-            apps=(GitHubApp(app_slug="my-bot", name="Bot"),),
+            users=(_ALICE,),
+            apps=(_MY_BOT,),
             app_installations=(
                 AppInstallation(
                     installation_id=1,
@@ -360,11 +421,9 @@ class TestInstallationTokenIntegration:
     @staticmethod
     def test_installation_token_combined_with_standalone_requires_default() -> None:
         """Multiple tokens (standalone + installation) require default_token."""
-        from simulacat import AccessToken
-
         scenario = ScenarioConfig(
-            users=(User(login="alice"),),
-            apps=(GitHubApp(app_slug="my-bot", name="Bot"),),
+            users=(_ALICE,),
+            apps=(_MY_BOT,),
             tokens=(AccessToken(value="ghs_standalone", owner="alice"),),
             app_installations=(
                 AppInstallation(
@@ -378,18 +437,16 @@ class TestInstallationTokenIntegration:
 
         with pytest.raises(
             ConfigValidationError,
-            match="Multiple tokens configured",
+            match=_ERR_MULTIPLE_TOKENS,
         ):
             scenario.resolve_auth_token()
 
     @staticmethod
     def test_installation_token_with_default_selection() -> None:
         """Default token selects between standalone and installation tokens."""
-        from simulacat import AccessToken
-
         scenario = ScenarioConfig(
-            users=(User(login="alice"),),
-            apps=(GitHubApp(app_slug="my-bot", name="Bot"),),
+            users=(_ALICE,),
+            apps=(_MY_BOT,),
             tokens=(AccessToken(value="ghs_standalone", owner="alice"),),
             app_installations=(
                 AppInstallation(
@@ -409,11 +466,9 @@ class TestInstallationTokenIntegration:
     @staticmethod
     def test_installation_token_must_not_duplicate_standalone_token() -> None:
         """Installation access_token must not duplicate a standalone token value."""
-        from simulacat import AccessToken
-
         scenario = ScenarioConfig(
-            users=(User(login="alice"),),
-            apps=(GitHubApp(app_slug="my-bot", name="Bot"),),
+            users=(_ALICE,),
+            apps=(_MY_BOT,),
             tokens=(AccessToken(value="ghs_same", owner="alice"),),
             app_installations=(
                 AppInstallation(
@@ -427,7 +482,7 @@ class TestInstallationTokenIntegration:
 
         with pytest.raises(
             ConfigValidationError,
-            match="Duplicate token value",
+            match=_ERR_DUP_TOKEN_VALUE,
         ):
             scenario.validate()
 
@@ -435,8 +490,8 @@ class TestInstallationTokenIntegration:
     def test_no_tokens_returns_none() -> None:
         """Apps without access_token and no standalone tokens resolve to None."""
         scenario = ScenarioConfig(
-            users=(User(login="alice"),),
-            apps=(GitHubApp(app_slug="my-bot", name="Bot"),),
+            users=(_ALICE,),
+            apps=(_MY_BOT,),
             app_installations=(
                 AppInstallation(
                     installation_id=1,
@@ -451,69 +506,49 @@ class TestInstallationTokenIntegration:
         )
 
 
+# Known-good configurations; one row per valid shape, validated in a
+# single parametrized test.
+_VALID_SCENARIO_CASES = [
+    pytest.param(_HAPPY_APP_SCENARIO, id="app-with-installation"),
+    pytest.param(
+        ScenarioConfig(
+            users=(User(login="octocat"),),
+            apps=(GitHubApp(app_slug="my-bot", name="My Bot"),),
+        ),
+        id="app-without-installations",
+    ),
+]
+
+
 class TestGitHubAppHappyPath:
     """Group happy-path tests for GitHub App configuration."""
 
     @staticmethod
-    def test_valid_app_and_installation_passes_validation() -> None:
-        """A valid GitHub App and installation scenario passes validation."""
-        scenario = ScenarioConfig(
-            users=(User(login="octocat"),),
-            repositories=(Repository(owner="octocat", name="hello-world"),),
-            apps=(
-                GitHubApp(
-                    app_slug="my-bot",
-                    name="My Bot",
-                    app_id=12345,
-                    owner="octocat",
-                ),
-            ),
-            app_installations=(
-                AppInstallation(
-                    installation_id=1,
-                    app_slug="my-bot",
-                    account="octocat",
-                    repositories=("octocat/hello-world",),
-                    permissions=("contents", "pull_requests"),
-                    access_token="ghs_installation_token",  # noqa: S106 — FIXME: use env or fixture for test tokens
-                ),
-            ),
-        )
-
+    @pytest.mark.parametrize("scenario", _VALID_SCENARIO_CASES)
+    def test_valid_scenarios_pass_validation(scenario: ScenarioConfig) -> None:
+        """Known-good app configurations pass validate() without raising."""
         scenario.validate()
-        assert scenario.resolve_auth_token() == "ghs_installation_token", (
-            "Expected configured installation token to resolve"
-        )
 
     @staticmethod
-    def test_app_without_installations_validates() -> None:
-        """A GitHub App with no installations is valid."""
-        scenario = ScenarioConfig(
-            users=(User(login="octocat"),),
-            apps=(GitHubApp(app_slug="my-bot", name="My Bot"),),
+    def test_happy_scenario_resolves_installation_token() -> None:
+        """The valid installation scenario resolves its configured token."""
+        assert _HAPPY_APP_SCENARIO.resolve_auth_token() == "ghs_installation_token", (
+            "Expected configured installation token to resolve"
         )
 
-        scenario.validate()
-
     @staticmethod
     def test_apps_not_serialized_to_simulator_config() -> None:
         """GitHub App metadata must not appear in the simulator configuration."""
-        scenario = ScenarioConfig(
-            users=(User(login="octocat"),),
-            repositories=(Repository(owner="octocat", name="demo"),),
-            apps=(GitHubApp(app_slug="my-bot", name="My Bot"),),
-            app_installations=(
-                AppInstallation(
-                    installation_id=1,
-                    app_slug="my-bot",
-                    account="octocat",
-                    repositories=("octocat/demo",),
-                ),
-            ),
-        )
-
-        config = scenario.to_simulator_config()
-        assert "apps" not in config, "Apps must not be serialized to simulator config"
-        assert "app_installations" not in config, (
+        keys = _HAPPY_APP_SCENARIO.simulator_config_keys()
+        assert "apps" not in keys, "Apps must not be serialized to simulator config"
+        assert "app_installations" not in keys, (
             "Installations must not be serialized to simulator config"
         )
+
+    @staticmethod
+    def test_simulator_config_keys_match_serialized_output() -> None:
+        """simulator_config_keys() mirrors the actual serialized key set."""
+        assert (
+            frozenset(_HAPPY_APP_SCENARIO.to_simulator_config())
+            == _HAPPY_APP_SCENARIO.simulator_config_keys()
+        ), "Expected declared config keys to match to_simulator_config output"
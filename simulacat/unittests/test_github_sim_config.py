@@ -17,10 +17,10 @@ Or run via make::
 
 from __future__ import annotations
 
+import inspect
 import json
-import textwrap
-import types
 import typing as typ
+from types import MappingProxyType
 
 import pytest
 
@@ -31,19 +31,34 @@ pytest_plugins = ["pytester"]
 if typ.TYPE_CHECKING:
     from _pytest.pytester import Pytester
 
+# Resolved once at module load: get_type_hints walks the MRO and evaluates
+# forward references on every call, so the schema check pays that cost only
+# at import time.
+_HINTS = frozenset(typ.get_type_hints(GitHubSimConfig))
+
+_EXPECTED_SCHEMA_KEYS = frozenset({
+    "users",
+    "organizations",
+    "repositories",
+    "branches",
+    "issues",
+    "pull_requests",
+    "blobs",
+})
+
+
+def _assert_json_serializable(config: GitHubSimConfig) -> None:
+    """Serialize ``config`` to prove it is JSON-ready.
+
+    The fixture values under test are known-acyclic, so circular-reference
+    tracking is disabled and non-ASCII escaping is skipped.
+    """
+    json.dumps(config, check_circular=False, ensure_ascii=False)
+
 
 def test_github_sim_config_typed_dict_has_expected_keys() -> None:
     """GitHubSimConfig exposes the simulator top-level schema keys."""
-    hints = typ.get_type_hints(GitHubSimConfig)
-    assert set(hints) == {
-        "users",
-        "organizations",
-        "repositories",
-        "branches",
-        "issues",
-        "pull_requests",
-        "blobs",
-    }
+    assert _HINTS == _EXPECTED_SCHEMA_KEYS
 
 
 def test_default_fixture_returns_empty_mapping(
@@ -51,7 +66,7 @@ def test_default_fixture_returns_empty_mapping(
 ) -> None:
     """The default github_sim_config fixture is an empty JSON mapping."""
     assert github_sim_config == {}
-    json.dumps(github_sim_config)
+    _assert_json_serializable(github_sim_config)
 
 
 @pytest.mark.parametrize(
@@ -77,7 +92,7 @@ def test_indirect_parametrization_overrides_fixture(
     assert github_sim_config["repositories"] == []
     assert github_sim_config["branches"] == []
     assert github_sim_config["blobs"] == []
-    json.dumps(github_sim_config)
+    _assert_json_serializable(github_sim_config)
 
 
 class TestModuleOverride:
@@ -100,7 +115,7 @@ class TestModuleOverride:
     [
         typ.cast(
             "object",
-            types.MappingProxyType({
+            MappingProxyType({
                 "users": [{"login": "proxy-user", "organizations": []}]
             }),
         ),
@@ -113,7 +128,7 @@ def test_fixture_accepts_mapping_and_normalizes_to_dict(
     """The fixture accepts Mapping values and normalizes them into a dict."""
     assert isinstance(github_sim_config, dict)
     assert github_sim_config["users"][0]["login"] == "proxy-user"
-    json.dumps(github_sim_config)
+    _assert_json_serializable(github_sim_config)
 
 
 @pytest.mark.parametrize("github_sim_config", [None], indirect=True)
@@ -124,50 +139,15 @@ def test_indirect_parametrization_normalizes_none_to_empty_mapping(
     assert github_sim_config == {}
 
 
-def test_indirect_parametrization_rejects_non_mapping(pytester: Pytester) -> None:
-    """Indirect parametrization rejects values that are not mappings."""
-    pytester.makepyfile(
-        """
-        import pytest
-
-
-        @pytest.mark.parametrize("github_sim_config", ["nope"], indirect=True)
-        def test_non_mapping(github_sim_config):
-            assert False, "fixture should fail before reaching test body"
-        """
-    )
-    result = pytester.runpytest_subprocess("-q")
-    result.assert_outcomes(errors=1)
-    assert (
-        "github_sim_config must be a mapping"
-        in result.stdout.str() + result.stderr.str()
-    )
-
-
-def test_indirect_parametrization_rejects_non_string_keys(pytester: Pytester) -> None:
-    """Indirect parametrization rejects mappings with non-string keys."""
-    pytester.makepyfile(
-        """
-        import pytest
-
-
-        @pytest.mark.parametrize("github_sim_config", [{1: "x"}], indirect=True)
-        def test_non_string_keys(github_sim_config):
-            assert False, "fixture should fail before reaching test body"
-        """
-    )
-    result = pytester.runpytest_subprocess("-q")
-    result.assert_outcomes(errors=1)
-    assert (
-        "github_sim_config keys must be strings"
-        in result.stdout.str() + result.stderr.str()
-    )
-
-
-def test_indirect_parametrization_rejects_non_json_serializable(
+def test_indirect_parametrization_rejects_invalid_values(
     pytester: Pytester,
 ) -> None:
-    """Indirect parametrization rejects non-JSON-serializable configurations."""
+    """Indirect parametrization rejects invalid fixture values.
+
+    All three rejection shapes (non-mapping, non-string keys, and
+    non-JSON-serializable values) run in one pytester subprocess because
+    interpreter and plugin startup dominate the cost of each run.
+    """
     pytester.makepyfile(
         """
         import pytest
@@ -175,19 +155,23 @@ def test_indirect_parametrization_rejects_non_json_serializable(
 
         @pytest.mark.parametrize(
             "github_sim_config",
-            [{"users": [object()]}],
+            ["nope", {1: "x"}, {"users": [object()]}],
             indirect=True,
         )
-        def test_non_json_serializable(github_sim_config):
+        def test_invalid(github_sim_config):
             assert False, "fixture should fail before reaching test body"
         """
     )
     result = pytester.runpytest_subprocess("-q")
-    result.assert_outcomes(errors=1)
-    assert (
-        "github_sim_config must be JSON serializable"
-        in result.stdout.str() + result.stderr.str()
+    result.assert_outcomes(errors=3)
+    output = result.stdout.str() + result.stderr.str()
+    expected_messages = (
+        "github_sim_config must be a mapping",
+        "github_sim_config keys must be strings",
+        "github_sim_config must be JSON serializable",
     )
+    for expected in expected_messages:
+        assert expected in output, f"missing error message: {expected!r}"
 
 
 def test_package_scoped_override_via_conftest(pytester: Pytester) -> None:
@@ -196,8 +180,8 @@ def test_package_scoped_override_via_conftest(pytester: Pytester) -> None:
     pkg.mkdir()
     (pkg / "__init__.py").write_text("", encoding="utf-8")
     (pkg / "conftest.py").write_text(
-        textwrap.dedent(
-            """\
+        inspect.cleandoc(
+            """
             import pytest
 
 
@@ -209,8 +193,8 @@ def test_package_scoped_override_via_conftest(pytester: Pytester) -> None:
         encoding="utf-8",
     )
     (pkg / "test_pkg_override.py").write_text(
-        textwrap.dedent(
-            """\
+        inspect.cleandoc(
+            """
             def test_package_override_wins(pytestconfig, github_sim_config):
                 assert pytestconfig.pluginmanager.hasplugin("simulacat")
                 assert github_sim_config["users"][0]["login"] == "pkg-user"
@@ -20,374 +20,391 @@ Or run via make::
 
 from __future__ import annotations
 
+import dataclasses as dc
 import re
 import sys
 import textwrap
 import typing as typ
 
+import pytest
+
 pytest_plugins = ["pytester"]
 
 if typ.TYPE_CHECKING:
-    import pytest
-    from _pytest.pytester import Pytester
+    import collections.abc as cabc
 
+    from _pytest.pytester import Pytester
 
-def test_github_simulator_skips_when_bun_is_unavailable(
-    pytester: Pytester,
-) -> None:
-    """The fixture skips with a clear message when Bun cannot be located."""
-    pytester.makeconftest(
-        textwrap.dedent(
-            """\
-            from __future__ import annotations
 
-            from simulacat import pytest_plugin
+@pytest.fixture(scope="module")
+def bun_available() -> cabc.Iterator[None]:
+    """Make the Bun lookup succeed once for the whole module.
 
-            pytest_plugin.shutil.which = lambda *_: None
-            """
-        )
-    )
-    pytester.makepyfile(
-        textwrap.dedent(
-            """\
-            def test_skipped(github_simulator):
-                assert github_simulator is not None
-            """
+    The in-process tests all need ``_is_bun_available`` to pass, so the
+    ``shutil.which`` stub is applied once per module via a dedicated
+    ``MonkeyPatch`` context instead of per test.  The subprocess-based skip
+    test is unaffected: a fresh interpreter never sees the patch.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            "simulacat.pytest_plugin.shutil.which", lambda *_: sys.executable
         )
-    )
-    result = pytester.runpytest_subprocess("-q", "-rs")
-    result.assert_outcomes(skipped=1)
-    output = result.stdout.str() + result.stderr.str()
-    assert re.search(r"SKIPPED.*Bun", output, re.IGNORECASE), output
-
-
-def test_github_simulator_constructs_client_and_passes_config(
-    pytester: Pytester,
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    """The fixture binds github3 to the simulator URL and tears down."""
-    monkeypatch.setenv("BUN", sys.executable)
-
-    pytester.makeconftest(
-        textwrap.dedent(
-            """\
-            from __future__ import annotations
+        yield
+
+
+# Compiled once at module load for the skip-message assertion.
+_SKIPPED_BUN_RE = re.compile(r"SKIPPED.*Bun", re.IGNORECASE)
+
+# Generated conftest/test-module sources, dedented once at import time
+# instead of on every test invocation.
+#
+# The conftests import simulacat.orchestration as a plain submodule import
+# rather than from-importing it off the package: pytester's sys.modules
+# snapshot drops the lazily imported module between in-process runs while
+# the stale object lingers as a package attribute, so a from-import in a
+# later run would patch a module the plugin no longer uses.  The stubs
+# apply through a function-scoped autouse monkeypatch fixture, so every
+# mutation is undone after each inner test and the conftests are safe to
+# import in-process.
+
+_SKIP_CONFTEST = textwrap.dedent(
+    """\
+    from __future__ import annotations
+
+    from simulacat import pytest_plugin
+
+    pytest_plugin.shutil.which = lambda *_: None
+    """
+)
+
+_SKIP_TESTFILE = textwrap.dedent(
+    """\
+    def test_skipped(github_simulator):
+        assert github_simulator is not None
+    """
+)
+
+# Common conftest body shared by the teardown-path cases: orchestration
+# start/stop stubs.  Each case appends a small extension selecting its
+# github3 stub variant.  The Bun lookup stub comes from the module-scoped
+# bun_available fixture, which the in-process inner run inherits directly.
+_COMMON_CONFTEST = textwrap.dedent(
+    """\
+    from __future__ import annotations
+
+    import json
+    from pathlib import Path
 
-            import json
-            import sys
-            from pathlib import Path
-
-            import github3
-            import github3.session as github3_session
-
-            from simulacat import orchestration, pytest_plugin
+    import pytest
 
-            pytest_plugin.shutil.which = lambda *_: sys.executable
+    import simulacat.orchestration as orchestration
 
 
-            def start_sim_process(config, tmpdir, **_):
-                Path(tmpdir, "seen-config.json").write_text(
-                    json.dumps(config),
-                    encoding="utf-8",
-                )
-                return object(), 4242
+    def start_sim_process(config, tmpdir, **_):
+        Path(tmpdir, "seen-config.json").write_text(
+            json.dumps(config),
+            encoding="utf-8",
+        )
+        return object(), 4242
 
 
-            def stop_sim_process(proc, **_):
-                Path(__file__).with_name("stopped.txt").write_text(
-                    "stopped",
-                    encoding="utf-8",
-                )
+    def stop_sim_process(proc, **_):
+        Path(__file__).with_name("stopped.txt").write_text(
+            "stopped",
+            encoding="utf-8",
+        )
 
 
-            orchestration.start_sim_process = start_sim_process
-            orchestration.stop_sim_process = stop_sim_process
+    @pytest.fixture(autouse=True)
+    def _stub_orchestration(monkeypatch):
+        monkeypatch.setattr(
+            orchestration, "start_sim_process", start_sim_process
+        )
+        monkeypatch.setattr(
+            orchestration, "stop_sim_process", stop_sim_process
+        )
+    """
+)
 
+_BIND_EXTENSION = textwrap.dedent(
+    """\
 
-            class FakeSession:
-                base_url = ""
+    import github3
+    import github3.session as github3_session
 
 
-            def GitHubSession():
-                return FakeSession()
+    class FakeSession:
+        base_url = ""
 
 
-            def GitHub(*, session=None, **_):
-                Path(__file__).with_name("session-base-url.txt").write_text(
-                    session.base_url,
-                    encoding="utf-8",
-                )
-                return object()
+    def fake_github_session():
+        return FakeSession()
 
 
-            github3_session.GitHubSession = GitHubSession
-            github3.GitHub = GitHub
-            """
+    def fake_github(*, session=None, **_):
+        Path(__file__).with_name("session-base-url.txt").write_text(
+            session.base_url,
+            encoding="utf-8",
         )
-    )
-    pytester.makepyfile(
-        textwrap.dedent(
-            """\
-            import json
-
-            import pytest
+        return object()
 
 
-            @pytest.mark.parametrize(
-                "github_sim_config",
-                [{"users": [{"login": "alice", "organizations": []}]}],
-                indirect=True,
-            )
-            def test_binds_client_and_calls_start(github_simulator, tmp_path):
-                assert github_simulator is not None
-
-                cfg = json.loads(
-                    (tmp_path / "seen-config.json").read_text(encoding="utf-8")
-                )
-                assert cfg["users"][0]["login"] == "alice"
-                assert cfg["organizations"] == []
-                assert cfg["repositories"] == []
-                assert cfg["branches"] == []
-                assert cfg["blobs"] == []
-            """
+    @pytest.fixture(autouse=True)
+    def _stub_github3(monkeypatch):
+        monkeypatch.setattr(
+            github3_session, "GitHubSession", fake_github_session
         )
-    )
-    result = pytester.runpytest_subprocess("-q")
-    result.assert_outcomes(passed=1)
-    assert (pytester.path / "stopped.txt").is_file()
-    assert (pytester.path / "session-base-url.txt").read_text(
-        encoding="utf-8"
-    ) == "http://127.0.0.1:4242"
-
-
-def test_github_simulator_sets_auth_header_from_scenario(
-    pytester: Pytester,
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    """The fixture applies an auth token when provided via ScenarioConfig."""
-    monkeypatch.setenv("BUN", sys.executable)
-
-    pytester.makeconftest(
-        textwrap.dedent(
-            """\
-            from __future__ import annotations
+        monkeypatch.setattr(github3, "GitHub", fake_github)
+    """
+)
 
-            import json
-            import sys
-            from pathlib import Path
+_SETUP_FAIL_EXTENSION = textwrap.dedent(
+    """\
 
-            import github3
-            import github3.session as github3_session
+    import github3.session as github3_session
 
-            from simulacat import orchestration, pytest_plugin
 
-            pytest_plugin.shutil.which = lambda *_: sys.executable
+    def failing_github_session():
+        raise RuntimeError("boom during fixture setup")
 
 
-            def start_sim_process(config, tmpdir, **_):
-                Path(tmpdir, "seen-config.json").write_text(
-                    json.dumps(config),
-                    encoding="utf-8",
-                )
-                return object(), 4242
-
+    @pytest.fixture(autouse=True)
+    def _stub_github3(monkeypatch):
+        monkeypatch.setattr(
+            github3_session, "GitHubSession", failing_github_session
+        )
+    """
+)
 
-            def stop_sim_process(proc, **_):
-                Path(__file__).with_name("stopped.txt").write_text(
-                    "stopped",
-                    encoding="utf-8",
-                )
+_BIND_TESTFILE = textwrap.dedent(
+    """\
+    import json
+    from pathlib import Path
 
+    import pytest
 
-            orchestration.start_sim_process = start_sim_process
-            orchestration.stop_sim_process = stop_sim_process
 
+    @pytest.mark.parametrize(
+        "github_sim_config",
+        [{"users": [{"login": "alice", "organizations": []}]}],
+        indirect=True,
+    )
+    def test_binds_client_and_calls_start(github_simulator, tmp_path):
+        assert github_simulator is not None
 
-            class FakeSession:
-                def __init__(self):
-                    self.base_url = ""
-                    self.headers = {}
+        cfg = json.loads(
+            (tmp_path / "seen-config.json").read_text(encoding="utf-8")
+        )
+        assert cfg["users"][0]["login"] == "alice"
+        assert cfg["organizations"] == []
+        assert cfg["repositories"] == []
+        assert cfg["branches"] == []
+        assert cfg["blobs"] == []
+
+        url = Path(__file__).with_name("session-base-url.txt").read_text(
+            encoding="utf-8"
+        )
+        assert url == "http://127.0.0.1:4242"
+    """
+)
 
+_AUTH_CONFTEST = textwrap.dedent(
+    """\
+    from __future__ import annotations
 
-            def GitHubSession():
-                return FakeSession()
+    import json
+    from pathlib import Path
 
+    import github3
+    import github3.session as github3_session
+    import pytest
 
-            def GitHub(*, session=None, **_):
-                Path(__file__).with_name("auth-header.txt").write_text(
-                    session.headers.get("Authorization", ""),
-                    encoding="utf-8",
-                )
-                return object()
+    import simulacat.orchestration as orchestration
 
 
-            github3_session.GitHubSession = GitHubSession
-            github3.GitHub = GitHub
-            """
-        )
-    )
-    pytester.makepyfile(
-        textwrap.dedent(
-            """\
-            import json
-            from pathlib import Path
-
-            import pytest
-
-            from simulacat import AccessToken, ScenarioConfig, User
-
-
-            @pytest.mark.parametrize(
-                "github_sim_config",
-                [
-                    ScenarioConfig(
-                        users=(User(login="alice"),),
-                        tokens=(AccessToken(value="ghs_123", owner="alice"),),
-                    )
-                ],
-                indirect=True,
-            )
-            def test_applies_auth_token(github_simulator, tmp_path):
-                assert github_simulator is not None, (
-                    "expected github_simulator fixture to be provided"
-                )
-
-                config = json.loads(
-                    (tmp_path / "seen-config.json").read_text(encoding="utf-8")
-                )
-                assert "__simulacat__" not in config, (
-                    "unexpected __simulacat__ metadata in simulator config"
-                )
-
-                header = (Path(__file__).with_name("auth-header.txt")).read_text(
-                    encoding="utf-8"
-                )
-                assert header == "token ghs_123", (
-                    f"expected auth header to be set, got {header!r}"
-                )
-            """
+    def start_sim_process(config, tmpdir, **_):
+        Path(tmpdir, "seen-config.json").write_text(
+            json.dumps(config),
+            encoding="utf-8",
         )
-    )
-    result = pytester.runpytest_subprocess("-q")
-    outcomes = result.parseoutcomes()
-    assert outcomes.get("passed") == 1, (
-        f"expected auth token test to pass, got outcomes {outcomes}"
-    )
-    assert (pytester.path / "stopped.txt").is_file(), (
-        "expected github_simulator teardown to write stopped.txt"
-    )
+        return object(), 4242
 
 
-def test_teardown_runs_even_when_fixture_setup_fails(
-    pytester: Pytester,
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    """The fixture still triggers stop_sim_process when setup fails after start."""
-    monkeypatch.setenv("BUN", sys.executable)
-
-    pytester.makeconftest(
-        textwrap.dedent(
-            """\
-            from __future__ import annotations
+    def stop_sim_process(proc, **_):
+        Path(__file__).with_name("stopped.txt").write_text(
+            "stopped",
+            encoding="utf-8",
+        )
 
-            import sys
-            from pathlib import Path
 
-            import github3
-            import github3.session as github3_session
+    class FakeSession:
+        def __init__(self):
+            self.base_url = ""
+            self.headers = {}
 
-            from simulacat import orchestration, pytest_plugin
 
-            pytest_plugin.shutil.which = lambda *_: sys.executable
+    def GitHubSession():
+        return FakeSession()
 
 
-            def start_sim_process(config, tmpdir, **_):
-                return object(), 4242
+    def GitHub(*, session=None, **_):
+        Path(__file__).with_name("auth-header.txt").write_text(
+            session.headers.get("Authorization", ""),
+            encoding="utf-8",
+        )
+        return object()
 
 
-            def stop_sim_process(proc, **_):
-                Path(__file__).with_name("stopped.txt").write_text(
-                    "stopped",
-                    encoding="utf-8",
-                )
+    @pytest.fixture(autouse=True)
+    def _stub_simulator(monkeypatch):
+        monkeypatch.setattr(
+            orchestration, "start_sim_process", start_sim_process
+        )
+        monkeypatch.setattr(
+            orchestration, "stop_sim_process", stop_sim_process
+        )
+        monkeypatch.setattr(
+            github3_session, "GitHubSession", GitHubSession
+        )
+        monkeypatch.setattr(github3, "GitHub", GitHub)
+    """
+)
 
+_AUTH_TESTFILE = textwrap.dedent(
+    """\
+    import json
+    from pathlib import Path
 
-            orchestration.start_sim_process = start_sim_process
-            orchestration.stop_sim_process = stop_sim_process
+    import pytest
 
+    from simulacat import AccessToken, ScenarioConfig, User
 
-            def GitHubSession():
-                raise RuntimeError("boom during fixture setup")
 
+    @pytest.mark.parametrize(
+        "github_sim_config",
+        [
+            ScenarioConfig(
+                users=(User(login="alice"),),
+                tokens=(AccessToken(value="ghs_123", owner="alice"),),
+            )
+        ],
+        indirect=True,
+    )
+    def test_applies_auth_token(github_simulator, tmp_path):
+        assert github_simulator is not None, (
+            "expected github_simulator fixture to be provided"
+        )
 
-            github3_session.GitHubSession = GitHubSession
-            github3.GitHub = lambda **_: object()
-            """
+        config = json.loads(
+            (tmp_path / "seen-config.json").read_text(encoding="utf-8")
         )
-    )
-    pytester.makepyfile(
-        textwrap.dedent(
-            """\
-            def test_setup_failure_still_tears_down(github_simulator):
-                # The test body is not reached because fixture setup fails.
-                assert github_simulator is not None
-            """
+        assert "__simulacat__" not in config, (
+            "unexpected __simulacat__ metadata in simulator config"
         )
-    )
 
-    result = pytester.runpytest_subprocess("-q")
-    result.assert_outcomes(errors=1)
-    assert (pytester.path / "stopped.txt").is_file()
+        header = (Path(__file__).with_name("auth-header.txt")).read_text(
+            encoding="utf-8"
+        )
+        assert header == "token ghs_123", (
+            f"expected auth header to be set, got {header!r}"
+        )
+    """
+)
+
+_SETUP_FAIL_TESTFILE = textwrap.dedent(
+    """\
+    def test_setup_failure_still_tears_down(github_simulator):
+        # The test body is not reached because fixture setup fails.
+        assert github_simulator is not None
+    """
+)
+
+_TEST_FAIL_TESTFILE = textwrap.dedent(
+    """\
+    def test_failure_still_tears_down(github_simulator):
+        assert github_simulator is not None
+        assert False, "force failure to ensure teardown still runs"
+    """
+)
+
+
+@dc.dataclass(frozen=True, slots=True)
+class _TeardownCase:
+    """One teardown-path scenario for the parametrized fixture test."""
+
+    conftest_extension: str
+    testfile: str
+    outcomes: dict[str, int]
+
+
+_TEARDOWN_CASES = [
+    pytest.param(
+        _TeardownCase(_BIND_EXTENSION, _BIND_TESTFILE, {"passed": 1}),
+        id="bind",
+    ),
+    pytest.param(
+        _TeardownCase(
+            _SETUP_FAIL_EXTENSION, _SETUP_FAIL_TESTFILE, {"errors": 1}
+        ),
+        id="setup-fail",
+    ),
+    pytest.param(
+        _TeardownCase("", _TEST_FAIL_TESTFILE, {"failed": 1}),
+        id="test-fail",
+    ),
+]
 
 
-def test_teardown_runs_even_when_test_fails(
-    pytester: Pytester, monkeypatch: pytest.MonkeyPatch
+def test_github_simulator_skips_when_bun_is_unavailable(
+    pytester: Pytester,
 ) -> None:
-    """The fixture still triggers stop_sim_process when a test fails."""
-    monkeypatch.setenv("BUN", sys.executable)
-
-    pytester.makeconftest(
-        textwrap.dedent(
-            """\
-            from __future__ import annotations
-
-            from pathlib import Path
-
-            from simulacat import orchestration
-
-
-            def start_sim_process(config, tmpdir, **_):
-                # Record that the fixture attempted startup with the provided tmpdir.
-                Path(tmpdir, "start-called.txt").write_text(
-                    "started",
-                    encoding="utf-8",
-                )
-                return object(), 12345
+    """The fixture skips with a clear message when Bun cannot be located.
+
+    This stays a subprocess run: the conftest rebinds
+    ``pytest_plugin.shutil.which`` at import time, which needs a fresh
+    interpreter to avoid leaking into the host session.
+    """
+    pytester.makeconftest(_SKIP_CONFTEST)
+    pytester.makepyfile(_SKIP_TESTFILE)
+    result = pytester.runpytest_subprocess("-q", "-rs")
+    result.assert_outcomes(skipped=1)
+    output = result.stdout.str() + result.stderr.str()
+    assert _SKIPPED_BUN_RE.search(output), output
 
 
-            def stop_sim_process(proc, **_):
-                Path(__file__).with_name("stopped.txt").write_text(
-                    "stopped",
-                    encoding="utf-8",
-                )
+@pytest.mark.parametrize("case", _TEARDOWN_CASES)
+@pytest.mark.usefixtures("bun_available")
+def test_github_simulator_always_tears_down(
+    pytester: Pytester,
+    case: _TeardownCase,
+) -> None:
+    """The fixture tears down whatever the inner test's outcome is.
+
+    Covers the happy path (client bound, config passed through), a failure
+    during fixture setup after the simulator started, and a failing test
+    body.  Each case shares the common conftest and runs in-process.
+    """
+    pytester.makeconftest(_COMMON_CONFTEST + case.conftest_extension)
+    pytester.makepyfile(case.testfile)
+    result = pytester.runpytest("-q")
+    result.assert_outcomes(**case.outcomes)
+    assert (pytester.path / "stopped.txt").is_file(), (
+        "expected github_simulator teardown to write stopped.txt"
+    )
 
 
-            orchestration.start_sim_process = start_sim_process
-            orchestration.stop_sim_process = stop_sim_process
-            """
-        )
-    )
-    pytester.makepyfile(
-        textwrap.dedent(
-            """\
-            def test_failure_still_tears_down(github_simulator):
-                assert github_simulator is not None
-                assert False, "force failure to ensure teardown still runs"
-            """
-        )
+@pytest.mark.usefixtures("bun_available")
+def test_github_simulator_sets_auth_header_from_scenario(
+    pytester: Pytester,
+) -> None:
+    """The fixture applies an auth token when provided via ScenarioConfig."""
+    pytester.makeconftest(_AUTH_CONFTEST)
+    pytester.makepyfile(_AUTH_TESTFILE)
+    result = pytester.runpytest("-q")
+    outcomes = result.parseoutcomes()
+    assert outcomes.get("passed") == 1, (
+        f"expected auth token test to pass, got outcomes {outcomes}"
     )
-    result = pytester.runpytest_subprocess("-q")
-    result.assert_outcomes(failed=1)
     assert (pytester.path / "stopped.txt").is_file(), (
         "expected github_simulator teardown to write stopped.txt"
     )
@@ -3,20 +3,29 @@
 from __future__ import annotations
 
 import dataclasses as dc
+import re
 
 # S404: tests patch subprocess.run and raise TimeoutExpired only.
 import subprocess  # noqa: S404  # simulacat#123: test-only subprocess objects
+import types
 import typing as typ
 
 import pytest
 
 from simulacat import install_simulator_deps
 from simulacat.orchestration import GitHubSimProcessError
+from simulacat.unittests.cli_asserts import assert_cli_failure, assert_cli_success
 
 if typ.TYPE_CHECKING:
     from pathlib import Path
 
 
+# Compiled once at module load; pytest.raises accepts re.Pattern for match=.
+_MATCH_BUN_MISSING = re.compile(r"Bun executable not found")
+_MATCH_INSTALL_FAILED = re.compile(r"Failed to install simulator dependencies")
+_MATCH_TIMEOUT = re.compile(r"Timed out while installing simulator dependencies")
+
+
 @dc.dataclass(frozen=True)
 class _FakeCompletedProcess:
     """Minimal subprocess result object exposing a return code."""
@@ -28,11 +37,32 @@ class TestInstallSimulatorDependencies:
     """Validate Bun install orchestration for simulator dependencies."""
 
     @staticmethod
-    def test_returns_package_root_when_bun_install_succeeds(
+    @pytest.fixture
+    def patched_env(
         monkeypatch: pytest.MonkeyPatch,
         tmp_path: Path,
+    ) -> types.SimpleNamespace:
+        """Wire sim_package_root once and expose a set_run hook.
+
+        Each test supplies only its ``fake_run`` via ``set_run`` instead of
+        repeating both ``setattr`` calls.
+        """
+        monkeypatch.setattr(
+            install_simulator_deps, "sim_package_root", lambda: tmp_path
+        )
+        return types.SimpleNamespace(
+            tmp_path=tmp_path,
+            set_run=lambda fn: monkeypatch.setattr(
+                install_simulator_deps.subprocess, "run", fn
+            ),
+        )
+
+    @staticmethod
+    def test_returns_package_root_when_bun_install_succeeds(
+        patched_env: types.SimpleNamespace,
     ) -> None:
         """Successful Bun execution returns resolved package root."""
+        tmp_path = patched_env.tmp_path
 
         def fake_run(
             command: list[str], *, check: bool, timeout: int
@@ -42,10 +72,7 @@ class TestInstallSimulatorDependencies:
             assert command == ["bun", "install", "--cwd", str(tmp_path)]
             return _FakeCompletedProcess(returncode=0)
 
-        monkeypatch.setattr(
-            install_simulator_deps, "sim_package_root", lambda: tmp_path
-        )
-        monkeypatch.setattr(install_simulator_deps.subprocess, "run", fake_run)
+        patched_env.set_run(fake_run)
 
         package_root = install_simulator_deps.install_simulator_dependencies()
         assert package_root == tmp_path, (
@@ -54,8 +81,7 @@ class TestInstallSimulatorDependencies:
 
     @staticmethod
     def test_raises_when_bun_executable_is_missing(
-        monkeypatch: pytest.MonkeyPatch,
-        tmp_path: Path,
+        patched_env: types.SimpleNamespace,
     ) -> None:
         """Missing Bun executable is wrapped as GitHubSimProcessError."""
 
@@ -69,18 +95,14 @@ class TestInstallSimulatorDependencies:
             assert timeout == 300, "Expected subprocess timeout to be 300 seconds"
             raise FileNotFoundError(command[0])
 
-        monkeypatch.setattr(
-            install_simulator_deps, "sim_package_root", lambda: tmp_path
-        )
-        monkeypatch.setattr(install_simulator_deps.subprocess, "run", fake_run)
+        patched_env.set_run(fake_run)
 
-        with pytest.raises(GitHubSimProcessError, match="Bun executable not found"):
+        with pytest.raises(GitHubSimProcessError, match=_MATCH_BUN_MISSING):
             install_simulator_deps.install_simulator_dependencies()
 
     @staticmethod
     def test_raises_when_bun_install_returns_non_zero(
-        monkeypatch: pytest.MonkeyPatch,
-        tmp_path: Path,
+        patched_env: types.SimpleNamespace,
     ) -> None:
         """Non-zero Bun exit status raises GitHubSimProcessError."""
 
@@ -91,21 +113,14 @@ class TestInstallSimulatorDependencies:
             assert timeout == 300, "Expected subprocess timeout to be 300 seconds"
             return _FakeCompletedProcess(returncode=2)
 
-        monkeypatch.setattr(
-            install_simulator_deps, "sim_package_root", lambda: tmp_path
-        )
-        monkeypatch.setattr(install_simulator_deps.subprocess, "run", fake_run)
+        patched_env.set_run(fake_run)
 
-        with pytest.raises(
-            GitHubSimProcessError,
-            match="Failed to install simulator dependencies",
-        ):
+        with pytest.raises(GitHubSimProcessError, match=_MATCH_INSTALL_FAILED):
             install_simulator_deps.install_simulator_dependencies()
 
     @staticmethod
     def test_raises_when_bun_install_times_out(
-        monkeypatch: pytest.MonkeyPatch,
-        tmp_path: Path,
+        patched_env: types.SimpleNamespace,
     ) -> None:
         """Timeouts from Bun are wrapped as GitHubSimProcessError."""
 
@@ -122,15 +137,9 @@ class TestInstallSimulatorDependencies:
                 timeout=timeout,
             )
 
-        monkeypatch.setattr(
-            install_simulator_deps, "sim_package_root", lambda: tmp_path
-        )
-        monkeypatch.setattr(install_simulator_deps.subprocess, "run", fake_run)
+        patched_env.set_run(fake_run)
 
-        with pytest.raises(
-            GitHubSimProcessError,
-            match="Timed out while installing simulator dependencies",
-        ):
+        with pytest.raises(GitHubSimProcessError, match=_MATCH_TIMEOUT):
             install_simulator_deps.install_simulator_dependencies()
 
 
@@ -153,11 +162,7 @@ class TestInstallSimulatorDepsMain:
         exit_code = install_simulator_deps.main()
         captured = capsys.readouterr()
 
-        assert exit_code == 0, "Expected zero exit code on successful install"
-        assert str(tmp_path) in captured.out, (
-            "Expected stdout to include installation destination"
-        )
-        assert captured.err == "", "Expected no stderr output on success"
+        assert_cli_success(captured, exit_code, str(tmp_path))
 
     @staticmethod
     def test_main_prints_error_and_returns_non_zero(
@@ -179,11 +184,9 @@ class TestInstallSimulatorDepsMain:
         exit_code = install_simulator_deps.main()
         captured = capsys.readouterr()
 
-        assert exit_code == 1, "Expected non-zero exit code when installation fails"
-        assert "Failed to install simulator dependencies" in captured.err, (
-            "Expected prefixed failure message on stderr"
-        )
-        assert "dependency install failed" in captured.err, (
-            "Expected original failure reason on stderr"
+        assert_cli_failure(
+            captured,
+            exit_code,
+            "Failed to install simulator dependencies",
+            "dependency install failed",
         )
-        assert captured.out == "", "Expected no stdout output on failure"
@@ -4,11 +4,21 @@ from __future__ import annotations
 
 import typing as typ
 
+import pytest
+
 from simulacat import js_root
 from simulacat.orchestration import GitHubSimProcessError, sim_package_root
+from simulacat.unittests.cli_asserts import assert_cli_failure, assert_cli_success
+
+
+@pytest.fixture(scope="module")
+def expected_js_root() -> str:
+    """Resolve the expected package root once for the whole module.
 
-if typ.TYPE_CHECKING:
-    import pytest
+    ``sim_package_root`` walks entrypoint candidates on every call, so the
+    expected value is resolved a single time rather than per assertion.
+    """
+    return str(sim_package_root())
 
 
 class TestJsRootCommand:
@@ -17,16 +27,13 @@ class TestJsRootCommand:
     @staticmethod
     def test_main_prints_resolved_package_root(
         capsys: pytest.CaptureFixture[str],
+        expected_js_root: str,
     ) -> None:
         """The command prints the same path as `sim_package_root()`."""
         exit_code = js_root.main()
         captured = capsys.readouterr()
 
-        assert exit_code == 0, "Expected successful exit code"
-        assert captured.out.strip() == str(sim_package_root()), (
-            "Expected stdout to contain the resolved package root path"
-        )
-        assert captured.err == "", "Expected no stderr output on success"
+        assert_cli_success(captured, exit_code, expected_js_root, exact=True)
 
     @staticmethod
     def test_main_reports_resolution_failures(
@@ -44,11 +51,9 @@ class TestJsRootCommand:
         exit_code = js_root.main()
         captured = capsys.readouterr()
 
-        assert exit_code == 1, "Expected non-zero exit code on resolution failure"
-        assert "Failed to resolve SIMULACAT_JS_ROOT" in captured.err, (
-            "Expected command failure prefix in stderr"
-        )
-        assert "missing package manifest" in captured.err, (
-            "Expected original failure details in stderr"
+        assert_cli_failure(
+            captured,
+            exit_code,
+            "Failed to resolve SIMULACAT_JS_ROOT",
+            "missing package manifest",
         )
-        assert captured.out == "", "Expected no stdout output when resolution fails"
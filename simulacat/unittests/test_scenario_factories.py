@@ -93,6 +93,19 @@ class TestScenarioFactories:
         with pytest.raises(ConfigValidationError, match="Owner"):
             single_repo_scenario("")
 
+    @staticmethod
+    def test_single_repo_scenario_accepts_str_subclass_owner() -> None:
+        """A str subclass (e.g. a str-based enum member) is a valid owner."""
+
+        class Login(str):  # noqa: FURB189  # the str-subclass path is the point
+            __slots__ = ()
+
+        scenario = single_repo_scenario(Login("alice"))
+
+        assert scenario.users == (User(login="alice"),), (
+            f"Expected user alice, got {scenario.users!r}"
+        )
+
     @staticmethod
     def test_monorepo_with_apps_requires_apps() -> None:
         """Monorepo factory requires at least one app name."""
@@ -152,6 +165,30 @@ class TestScenarioMerging:
             f"Expected repositories alpha and beta, got {repo_names!r}"
         )
 
+    @staticmethod
+    def test_merge_scenarios_deduplicates_within_single_scenario() -> None:
+        """A lone scenario still has identical duplicate entries collapsed."""
+        scenario = ScenarioConfig(users=(User(login="alice"), User(login="alice")))
+
+        merged = merge_scenarios(scenario)
+
+        assert merged.users == (User(login="alice"),), (
+            f"Expected duplicate users to collapse, got {merged.users!r}"
+        )
+
+    @staticmethod
+    def test_merge_scenarios_conflicts_raise_within_single_scenario() -> None:
+        """A lone scenario with conflicting duplicate entries raises."""
+        scenario = ScenarioConfig(
+            users=(User(login="alice"), User(login="alice", name="Other")),
+        )
+
+        with pytest.raises(
+            ConfigValidationError,
+            match="Conflicting user definition for alice",
+        ):
+            merge_scenarios(scenario)
+
     @staticmethod
     def test_merge_scenarios_preserves_branch_sets() -> None:
         """Branch definitions from multiple scenarios are merged."""